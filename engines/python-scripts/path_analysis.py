@@ -35,6 +35,10 @@ Expects the following variables in the execution namespace (injected by the engi
   missingValues : str
       "exclude-listwise" | "fiml". Default: "exclude-listwise".
 
+  diagramLayout : str
+      "aos" | "columns". Default: "aos" (a dict per node/edge). "columns"
+      returns "nodes"/"edges" in columnar form instead (one list per field).
+
 Result structure
 ----------------
 {
@@ -102,7 +106,12 @@ Result structure
   } | null,
   "r_squared": {var: float, ...} | null,
   "residual_variances": {var: {"estimate": float, "se": float | null}, ...} | null,
-  "diagram": {"nodes": [...], "edges": [...]} | null,
+  "diagram": {
+    "nodes": [{"id": str, "label": str, "type": str}, ...],
+    "edges": [{"from": str, "to": str, "estimate": float, "p_value": float | null,
+               "significant": bool, "std_estimate": float  # if standardized}, ...],
+  } | null,   # with diagramLayout="columns": {"nodes": {"id": [...], ...},
+              #                                 "edges": {"from": [...], ...}}
   "standardized": bool,
   "bootstrap": bool,
   "n_boot": int | null,
@@ -113,17 +122,28 @@ Result structure
 
 from __future__ import annotations
 
+import os
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from scipy import stats as scipy_stats
+from scipy.linalg import solve_triangular
+
+# Numeric-only terms (fixed values such as "1" or "0.5") are not variables
+_NUM_RE = re.compile(r"^[0-9.]+$")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _strip_label(term: str) -> str:
+    """Remove a label annotation (e.g., "a*x1" -> "x1")."""
+    return term.rsplit("*", 1)[-1].strip()
+
+
 def _to_dataframe(raw) -> pd.DataFrame:
     if isinstance(raw, pd.DataFrame):
         return raw
@@ -134,6 +154,21 @@ def _to_dataframe(raw) -> pd.DataFrame:
     raise TypeError(f"Unsupported data type: {type(raw)}")
 
 
+def _num_col(frame: pd.DataFrame, *names: str) -> np.ndarray:
+    """First of `names` present in `frame`, as a float array (all-NaN if none)."""
+    for name in names:
+        if name in frame.columns:
+            return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64)
+    return np.full(len(frame), np.nan)
+
+
+def _round_list(values: np.ndarray, ndigits: int) -> list:
+    """Round a whole column at once; NaN entries come back as None."""
+    rounded = np.round(values, ndigits).astype(object)
+    rounded[np.isnan(values)] = None
+    return rounded.tolist()
+
+
 def _build_syntax_from_paths(paths_raw: list) -> str:
     """Convert structured paths list to lavaan/semopy model syntax."""
     path_map: dict[str, list[str]] = {}
@@ -154,13 +189,17 @@ def _build_syntax_from_paths(paths_raw: list) -> str:
     return "\n".join(lines)
 
 
-def _parse_model_variables(syntax: str) -> tuple[list[str], list[str], list[str]]:
+def _parse_model_variables(
+    syntax: str,
+) -> tuple[list[str], list[str], list[str], dict[str, list[str]]]:
     """
-    Parse model syntax to identify endogenous and exogenous variables.
-    Returns (endogenous, exogenous, all_vars).
+    Parse model syntax to identify endogenous and exogenous variables and
+    the predictors of each outcome.
+    Returns (endogenous, exogenous, all_vars, path_map).
     """
     endogenous: list[str] = []
     all_vars:   list[str] = []
+    path_map:   dict[str, list[str]] = {}
 
     for line in syntax.splitlines():
         line = line.strip()
@@ -170,19 +209,21 @@ def _parse_model_variables(syntax: str) -> tuple[list[str], list[str], list[str]
             parts = line.split("~", 1)
             lhs = parts[0].strip()
             rhs = parts[1].strip()
-            # Remove label annotations (e.g., "a*x1" -> "x1")
-            lhs_var = re.sub(r".*\*", "", lhs).strip()
+            lhs_var = _strip_label(lhs)
             if lhs_var and lhs_var not in endogenous:
                 endogenous.append(lhs_var)
             if lhs_var and lhs_var not in all_vars:
                 all_vars.append(lhs_var)
-            for term in rhs.split("+"):
-                var_part = re.sub(r".*\*", "", term.strip()).strip()
-                if var_part and not re.match(r"^[0-9.]+$", var_part) and var_part not in all_vars:
+            preds = [_strip_label(t) for t in rhs.split("+")]
+            preds = [p for p in preds if p and not _NUM_RE.match(p)]
+            for var_part in preds:
+                if var_part not in all_vars:
                     all_vars.append(var_part)
+            if lhs_var:
+                path_map[lhs_var] = preds
 
     exogenous = [v for v in all_vars if v not in endogenous]
-    return endogenous, exogenous, all_vars
+    return endogenous, exogenous, all_vars, path_map
 
 
 def _run_semopy(
@@ -208,8 +249,9 @@ def _run_semopy(
     except Exception:
         params = mod.inspect()
 
-    # Fit indices
+    # Fit indices (calc_stats is the expensive part; computed exactly once)
     fit_dict = {}
+    stats = None
     try:
         stats = semopy.calc_stats(mod)
 
@@ -237,16 +279,52 @@ def _run_semopy(
     except Exception:
         fit_dict = {}
 
-    # R-squared
-    r2_dict = {}
-    try:
-        r2_raw = semopy.calc_stats(mod)  # some versions include R2
-        # Extract from params: endogenous var residuals
-        # We'll compute r2 from regression params instead (done later)
-    except Exception:
-        pass
+    # semopy's stats carry no R2; it is computed from regression params later
+    return {"params": params, "fit_indices": fit_dict, "model": mod, "stats_df": stats}
 
-    return {"params": params, "fit_indices": fit_dict, "model": mod}
+
+def _ols_multi(X_raw: np.ndarray, Y: np.ndarray, ci_level: float) -> dict:
+    """
+    OLS of every column of Y on the same predictors (intercept added),
+    solved through a Cholesky factorization of X'X. Statistics are arrays
+    shaped (n_coef, n_outcomes) or (n_outcomes,), matching statsmodels' OLS
+    results.
+    """
+    n, k = X_raw.shape
+    X = np.column_stack([np.ones(n), X_raw])
+    XtX = X.T @ X
+    XtY = X.T @ Y
+    try:
+        # Normal equations via Cholesky: two triangular solves on a tiny system
+        L = np.linalg.cholesky(XtX)
+        L_inv = solve_triangular(L, np.eye(k + 1), lower=True)
+        params = solve_triangular(L.T, solve_triangular(L, XtY, lower=True), lower=False)
+        xtx_inv_diag = (L_inv ** 2).sum(axis=0)
+    except np.linalg.LinAlgError:
+        # Collinear predictors: minimum-norm solution, as statsmodels does
+        XtX_pinv = np.linalg.pinv(XtX)
+        params = XtX_pinv @ XtY
+        xtx_inv_diag = np.diag(XtX_pinv)
+    resid = Y - X @ params
+    df_resid = n - k - 1
+    ssr = (resid ** 2).sum(axis=0)
+    bse = np.sqrt(np.outer(xtx_inv_diag, ssr / df_resid))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tvalues = params / bse
+    pvalues = 2 * scipy_stats.t.sf(np.abs(tvalues), df_resid)
+    t_crit = scipy_stats.t.ppf(1 - (1 - ci_level) / 2, df_resid)
+    dev = Y - Y.mean(axis=0)
+    centered_tss = (dev ** 2).sum(axis=0)
+    return {
+        "params":    params,
+        "bse":       bse,
+        "tvalues":   tvalues,
+        "pvalues":   pvalues,
+        "ci_lower":  params - t_crit * bse,
+        "ci_upper":  params + t_crit * bse,
+        "rsquared":  1 - ssr / centered_tss,
+        "resid_var": resid.var(axis=0, ddof=1),
+    }
 
 
 def _run_ols_fallback(
@@ -254,7 +332,7 @@ def _run_ols_fallback(
     endo_vars: list[str],
     exo_vars: list[str],
     all_vars: list[str],
-    model_syntax: str,
+    path_map: dict[str, list[str]],
     do_std: bool,
     ci_level: float,
 ) -> dict:
@@ -262,81 +340,82 @@ def _run_ols_fallback(
     Fallback: fit each endogenous variable via OLS (ignores cross-equation constraints).
     Returns same shape as _run_semopy output.
     """
-    import statsmodels.api as sm
-
-    # Parse which predictors go to each outcome
-    path_map: dict[str, list[str]] = {}
-    for line in model_syntax.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "~" in line and "~~" not in line:
-            parts = line.split("~", 1)
-            outcome = re.sub(r".*\*", "", parts[0].strip()).strip()
-            preds_raw = parts[1].strip().split("+")
-            preds = [re.sub(r".*\*", "", t.strip()).strip() for t in preds_raw]
-            preds = [p for p in preds if p and not re.match(r"^[0-9.]+$", p)]
-            path_map[outcome] = preds
-
-    rows = []
-    r2_dict: dict[str, float] = {}
-    n_obs_total = len(df)
-
+    # Outcomes sharing a predictor set (and the same complete rows) are solved
+    # as one multi-column regression: a single factorization serves them all.
+    groups: dict[tuple, list[str]] = {}
     for outcome, preds in path_map.items():
         if not preds:
             continue
-        _cols = [outcome] + preds
-        _df_sub = df[_cols].dropna()
-        if len(_df_sub) < len(preds) + 2:
-            continue
-
-        Y = _df_sub[outcome].values
-        X_raw = _df_sub[preds].values
-        X = sm.add_constant(X_raw, has_constant="add")
-        fit = sm.OLS(Y, X).fit()
-
-        r2_dict[outcome] = float(fit.rsquared)
-
-        z_crit = scipy_stats.norm.ppf(1 - (1 - ci_level) / 2)
-        ci_arr = fit.conf_int(alpha=(1 - ci_level))
+        _complete = df[[outcome] + preds].notna().all(axis=1).to_numpy()
+        groups.setdefault((tuple(preds), _complete.tobytes()), []).append(outcome)
+
+    def _fit_group(preds_key: tuple, outcomes: list[str]) -> dict[str, dict]:
+        fitted: dict[str, dict] = {}
+        preds = list(preds_key)
+        _complete = df[[outcomes[0]] + preds].notna().all(axis=1).to_numpy()
+        if _complete.sum() < len(preds) + 2:
+            return fitted
+        Y = df.loc[_complete, outcomes].to_numpy(dtype=np.float64)
+        X_raw = df.loc[_complete, preds].to_numpy(dtype=np.float64)
+        ols = _ols_multi(X_raw, Y, ci_level)
 
         # Standardized: use beta coefficients
         if do_std:
-            std_Y = np.std(Y, ddof=1)
+            std_Y = np.std(Y, axis=0, ddof=1)
             std_X = np.std(X_raw, axis=0, ddof=1)
 
-        for i, pred in enumerate(preds):
-            param_idx = i + 1  # +1 for const
-            est = float(fit.params[param_idx])
-            se  = float(fit.bse[param_idx])
-            z   = float(fit.tvalues[param_idx])
-            pv  = float(fit.pvalues[param_idx])
-            row = {
+        for j, outcome in enumerate(outcomes):
+            out_rows = []
+            for i, pred in enumerate(preds):
+                param_idx = i + 1  # +1 for const
+                est = float(ols["params"][param_idx, j])
+                row = {
+                    "lval": outcome,
+                    "op":   "~",
+                    "rval": pred,
+                    "Estimate": est,
+                    "Std. Err": float(ols["bse"][param_idx, j]),
+                    "z-value":  float(ols["tvalues"][param_idx, j]),
+                    "p-value":  float(ols["pvalues"][param_idx, j]),
+                    "ci_lower": float(ols["ci_lower"][param_idx, j]),
+                    "ci_upper": float(ols["ci_upper"][param_idx, j]),
+                }
+                if do_std and std_Y[j] > 0 and std_X[i] > 0:
+                    row["std_estimate"] = est * std_X[i] / std_Y[j]
+                out_rows.append(row)
+
+            # Residual variance
+            out_rows.append({
                 "lval": outcome,
-                "op":   "~",
-                "rval": pred,
-                "Estimate": est,
-                "Std. Err": se,
-                "z-value":  z,
-                "p-value":  pv,
-                "ci_lower": float(ci_arr[param_idx, 0]),
-                "ci_upper": float(ci_arr[param_idx, 1]),
-            }
-            if do_std and std_Y > 0 and std_X[i] > 0:
-                row["std_estimate"] = est * std_X[i] / std_Y
-            rows.append(row)
-
-        # Residual variance
-        resid_var = float(np.var(fit.resid, ddof=1))
-        rows.append({
-            "lval": outcome,
-            "op":   "~~",
-            "rval": outcome,
-            "Estimate": resid_var,
-            "Std. Err": None,
-            "z-value":  None,
-            "p-value":  None,
-        })
+                "op":   "~~",
+                "rval": outcome,
+                "Estimate": float(ols["resid_var"][j]),
+                "Std. Err": None,
+                "z-value":  None,
+                "p-value":  None,
+            })
+            fitted[outcome] = {"rows": out_rows, "r2": float(ols["rsquared"][j])}
+        return fitted
+
+    # Each group is a handful of BLAS calls that release the GIL, so a small
+    # thread pool overlaps them without any pickling cost.
+    group_items = list(groups.items())
+    if len(group_items) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(group_items))) as pool:
+            group_fits = list(pool.map(lambda kv: _fit_group(kv[0][0], kv[1]), group_items))
+    else:
+        group_fits = [_fit_group(key[0], outcomes) for key, outcomes in group_items]
+    fits: dict[str, dict] = {}
+    for _g in group_fits:
+        fits.update(_g)
+
+    # Emit in model-syntax order regardless of how outcomes were grouped
+    rows = []
+    r2_dict: dict[str, float] = {}
+    for outcome in path_map:
+        if outcome in fits:
+            rows.extend(fits[outcome]["rows"])
+            r2_dict[outcome] = fits[outcome]["r2"]
 
     # Exogenous variable variances
     for exo in exo_vars:
@@ -368,83 +447,251 @@ def _run_ols_fallback(
 # Bootstrap indirect effects
 # ---------------------------------------------------------------------------
 
+# Replicates whose resample indices are drawn (and processed) together
+_BOOT_BLOCK = 256
+
+# Cap on the elements of one gathered (replicates, n, p) design tensor in the
+# NumPy path (~16 MB in float32); large samples use smaller blocks
+_GATHER_MAX_ELEMS = 4_000_000
+
+# Scripts are exec'd from source, so numba cannot cache the compiled kernel and
+# every run pays a few seconds of compilation. Below this many resampled rows
+# (n_boot * n) the NumPy loop finishes sooner.
+_NUMBA_MIN_WORK = 50_000_000
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional accelerator; the NumPy loop is used instead
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True)
+    def _boot_kernel(arr, idx, eq_cols, eq_ptr, ab_slots, out, out_offset):
+        """
+        Fit every equation on each resample in `idx` and store a*b products.
+
+        Equation e uses columns eq_cols[eq_ptr[e]:eq_ptr[e + 1]] (outcome
+        first). The slope for the predictor at position j of eq_cols is kept
+        in coefs[j]; ab_slots[k] holds the (a, b) slots of indirect pair k.
+        """
+        n_rep, n = idx.shape
+        n_eq = eq_ptr.shape[0] - 1
+        for r in prange(n_rep):
+            coefs = np.full(eq_cols.shape[0], np.nan)
+            for e in range(n_eq):
+                lo = eq_ptr[e]
+                p = eq_ptr[e + 1] - lo  # intercept + predictors
+                xtx = np.zeros((p, p))
+                xty = np.zeros(p)
+                x = np.empty(p)
+                m = 0
+                for i in range(n):
+                    row = idx[r, i]
+                    complete = True
+                    for j in range(lo, lo + p):
+                        if np.isnan(arr[row, eq_cols[j]]):
+                            complete = False
+                            break
+                    if not complete:
+                        continue
+                    m += 1
+                    x[0] = 1.0
+                    for j in range(1, p):
+                        x[j] = arr[row, eq_cols[lo + j]]
+                    y = arr[row, eq_cols[lo]]
+                    for u in range(p):
+                        xty[u] += x[u] * y
+                        for v in range(u + 1):
+                            xtx[u, v] += x[u] * x[v]
+                if m < p + 1:
+                    continue
+                # In-place Cholesky of the lower triangle; give up if singular
+                singular = False
+                for u in range(p):
+                    d = xtx[u, u]
+                    for w in range(u):
+                        d -= xtx[u, w] * xtx[u, w]
+                    if d <= 0.0:
+                        singular = True
+                        break
+                    xtx[u, u] = np.sqrt(d)
+                    for v in range(u + 1, p):
+                        t = xtx[v, u]
+                        for w in range(u):
+                            t -= xtx[v, w] * xtx[u, w]
+                        xtx[v, u] = t / xtx[u, u]
+                if singular:
+                    continue
+                # Forward then back substitution: L z = X'y, L' beta = z
+                for u in range(p):
+                    t = xty[u]
+                    for w in range(u):
+                        t -= xtx[u, w] * xty[w]
+                    xty[u] = t / xtx[u, u]
+                for u in range(p - 1, -1, -1):
+                    t = xty[u]
+                    for w in range(u + 1, p):
+                        t -= xtx[w, u] * xty[w]
+                    xty[u] = t / xtx[u, u]
+                for j in range(1, p):
+                    coefs[lo + j] = xty[j]
+            for k in range(ab_slots.shape[0]):
+                out[k, out_offset + r] = coefs[ab_slots[k, 0]] * coefs[ab_slots[k, 1]]
+else:
+    _boot_kernel = None
+
+
+def _batched_ols(design: np.ndarray, y: np.ndarray, complete: np.ndarray,
+                 idx: np.ndarray) -> np.ndarray:
+    """
+    OLS coefficients of every resample in `idx` (n_rep, n) in one batch.
+
+    `design` holds the intercept and predictor columns. Rows that are not
+    `complete` must be zero in both `design` and `y` so they drop out of X'X
+    and X'y. Replicates that cannot be fitted are left as NaN.
+    """
+    Xb = design[idx]                              # (n_rep, n, p)
+    Xt = Xb.transpose(0, 2, 1)
+    xtx = Xt @ Xb
+    xty = (Xt @ y[idx][..., None])[..., 0]
+    coefs = np.full(xty.shape, np.nan)
+    ok = complete[idx].sum(axis=1) >= design.shape[1] + 1
+    try:
+        coefs[ok] = np.linalg.solve(xtx[ok], xty[ok][..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # One singular resample fails the whole batch; redo them one by one
+        for r in np.flatnonzero(ok):
+            try:
+                coefs[r] = np.linalg.solve(xtx[r], xty[r])
+            except np.linalg.LinAlgError:
+                pass
+    return coefs
+
+
 def _bootstrap_indirect(
     df: pd.DataFrame,
-    model_syntax: str,
-    endo_vars: list[str],
-    exo_vars: list[str],
+    path_map: dict[str, list[str]],
+    all_vars: list[str],
     indirect_pairs: list[tuple[str, str, str]],  # (from, through, to)
     n_boot: int,
     ci_level: float,
 ) -> dict[tuple, dict]:
     """Compute bootstrap CIs for indirect effects using OLS."""
-    import statsmodels.api as sm
-
-    def _fit_paths(df_b: pd.DataFrame) -> dict[tuple, float]:
-        coefs: dict[tuple, float] = {}
-        _, _, all_vars = _parse_model_variables(model_syntax)
-        path_map: dict[str, list[str]] = {}
-        for line in model_syntax.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "~" in line and "~~" not in line:
-                parts = line.split("~", 1)
-                outcome = re.sub(r".*\*", "", parts[0]).strip()
-                preds_raw = parts[1].strip().split("+")
-                preds = [re.sub(r".*\*", "", t.strip()).strip() for t in preds_raw
-                         if not re.match(r"^[0-9.]+$", re.sub(r".*\*", "", t.strip()).strip())]
-                path_map[outcome] = preds
-
-        for outcome, preds in path_map.items():
-            if not preds:
-                continue
-            _cols = [outcome] + preds
-            _df_s = df_b[_cols].dropna()
-            if len(_df_s) < len(preds) + 2:
-                continue
-            Y = _df_s[outcome].values
-            X = sm.add_constant(_df_s[preds].values, has_constant="add")
-            try:
-                fit = sm.OLS(Y, X).fit()
-                for i, pred in enumerate(preds):
-                    coefs[(outcome, pred)] = float(fit.params[i + 1])
-            except Exception:
-                pass
-        return coefs
-
-    boot_results: dict[tuple, list[float]] = {pair: [] for pair in indirect_pairs}
+    # Resample raw rows of one float matrix; columns are addressed by index.
+    # The kernel runs in float32 to halve memory traffic. Columns are centred
+    # in float64 first (slopes are shift-invariant) so the single-precision
+    # normal equations stay well conditioned.
+    arr64 = df[all_vars].to_numpy(dtype=np.float64)
+    arr = np.ascontiguousarray((arr64 - np.nanmean(arr64, axis=0)).astype(np.float32))
+    col_idx = {name: i for i, name in enumerate(all_vars)}
+    # (outcome, predictors, [outcome column, *predictor columns]) per equation
+    plan = [
+        (outcome, preds, [col_idx[outcome], *(col_idx[p] for p in preds)])
+        for outcome, preds in path_map.items() if preds
+    ]
 
-    np.random.seed(20240201)
-    for _ in range(n_boot):
-        idx = np.random.choice(len(df), size=len(df), replace=True)
-        df_b = df.iloc[idx].reset_index(drop=True)
-        try:
-            coefs = _fit_paths(df_b)
-        except Exception:
-            continue
-        for from_var, through, to_var in indirect_pairs:
+    # One row per indirect pair; replicates that fail to fit stay NaN
+    boot_mat = np.full((len(indirect_pairs), n_boot), np.nan)
+
+    n_rows = len(arr)
+    use_jit = _boot_kernel is not None and n_boot * n_rows >= _NUMBA_MIN_WORK
+    block = _BOOT_BLOCK
+    if not use_jit:
+        # Per equation: intercept + predictor design and outcome, with
+        # incomplete rows zeroed so every resample is fitted in one batch
+        designs = []
+        for outcome, preds, cols in plan:
+            sub = arr[:, cols]
+            complete = ~np.isnan(sub).any(axis=1)
+            design = np.column_stack([np.ones(n_rows, dtype=np.float32), sub[:, 1:]])
+            design[~complete] = 0.0
+            designs.append((outcome, preds, design, np.where(complete, sub[:, 0], 0.0), complete))
+        p_max = max((len(cols) for _, _, cols in plan), default=1)
+        block = int(np.clip(_GATHER_MAX_ELEMS // (n_rows * p_max), 1, _BOOT_BLOCK))
+
+    def _block_products(idx_block: np.ndarray) -> np.ndarray:
+        coefs: dict[tuple, np.ndarray] = {}
+        for outcome, preds, design, y, complete in designs:
+            params = _batched_ols(design, y, complete, idx_block)
+            for i, pred in enumerate(preds):
+                coefs[(outcome, pred)] = params[:, i + 1]
+        products = np.full((len(indirect_pairs), len(idx_block)), np.nan)
+        for p_i, (from_var, through, to_var) in enumerate(indirect_pairs):
             a = coefs.get((through, from_var), None)
             b = coefs.get((to_var, through), None)
             if a is not None and b is not None:
-                boot_results[(from_var, through, to_var)].append(a * b)
-
-    ci_result: dict[tuple, dict] = {}
-    alpha_tail = (1 - ci_level) / 2
-    for pair, samples in boot_results.items():
-        valid = [s for s in samples if np.isfinite(s)]
-        if len(valid) >= 10:
-            ci_result[pair] = {
-                "boot_se":    float(np.std(valid, ddof=1)),
-                "ci_lower":   float(np.percentile(valid, alpha_tail * 100)),
-                "ci_upper":   float(np.percentile(valid, (1 - alpha_tail) * 100)),
-                "significant": not (
-                    np.percentile(valid, alpha_tail * 100) <= 0 <=
-                    np.percentile(valid, (1 - alpha_tail) * 100)
-                ),
+                products[p_i] = a * b
+        return products
+    if use_jit:
+        # Flatten the plan: slot j of eq_cols doubles as the coefficient slot
+        # of the predictor stored there
+        eq_cols = np.array([c for _, _, cols in plan for c in cols], dtype=np.int64)
+        eq_ptr = np.cumsum([0] + [len(cols) for _, _, cols in plan]).astype(np.int64)
+        slot: dict[tuple, int] = {}
+        for (outcome, preds, _), lo in zip(plan, eq_ptr):
+            for i, pred in enumerate(preds):
+                slot[(outcome, pred)] = int(lo) + 1 + i
+        jit_rows = [
+            p_i for p_i, (f, t, y) in enumerate(indirect_pairs)
+            if (t, f) in slot and (y, t) in slot
+        ]
+        ab_slots = np.array(
+            [[slot[(indirect_pairs[p_i][1], indirect_pairs[p_i][0])],
+              slot[(indirect_pairs[p_i][2], indirect_pairs[p_i][1])]] for p_i in jit_rows],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        jit_out = np.full((len(jit_rows), n_boot), np.nan)
+
+    # Local Generator: reproducible without touching the global RandomState.
+    # Indices are drawn a block at a time; the stream is identical to drawing
+    # them one replicate at a time, so both code paths (and any block size)
+    # see the same resamples.
+    rng = np.random.default_rng(20240201)
+    if use_jit:
+        for start in range(0, n_boot, block):
+            n_rep = min(block, n_boot - start)
+            idx_block = rng.integers(0, n_rows, size=(n_rep, n_rows), dtype=np.intp)
+            _boot_kernel(arr, idx_block, eq_cols, eq_ptr, ab_slots, jit_out, start)
+        boot_mat[jit_rows] = jit_out
+    else:
+        def _fill(start: int, idx_block: np.ndarray) -> None:
+            boot_mat[:, start:start + len(idx_block)] = _block_products(idx_block)
+
+        # Blocks are independent and spend their time in GIL-releasing BLAS/
+        # LAPACK calls, so threads overlap them without pickling the data.
+        # Indices are still drawn here, in order, to keep the stream fixed;
+        # at most two blocks per worker are in flight to bound memory.
+        n_workers = min(8, os.cpu_count() or 1, -(-n_boot // block))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            pending = []
+            for start in range(0, n_boot, block):
+                n_rep = min(block, n_boot - start)
+                idx_block = rng.integers(0, n_rows, size=(n_rep, n_rows), dtype=np.intp)
+                pending.append(pool.submit(_fill, start, idx_block))
+                if len(pending) >= 2 * n_workers:
+                    pending.pop(0).result()
+            for fut in pending:
+                fut.result()
+
+    boot_mat[~np.isfinite(boot_mat)] = np.nan
+    n_valid = np.sum(~np.isnan(boot_mat), axis=1)
+    ok = n_valid >= 10
+
+    ci_result: dict[tuple, dict] = {pair: {} for pair in indirect_pairs}
+    if ok.any():
+        alpha_tail = (1 - ci_level) / 2
+        # A single batched call sorts every pair's replicates once
+        lo, hi = np.nanpercentile(
+            boot_mat[ok], [alpha_tail * 100, (1 - alpha_tail) * 100], axis=1
+        )
+        se = np.nanstd(boot_mat[ok], axis=1, ddof=1)
+        for j, p_i in enumerate(np.flatnonzero(ok)):
+            ci_result[indirect_pairs[p_i]] = {
+                "boot_se":     float(se[j]),
+                "ci_lower":    float(lo[j]),
+                "ci_upper":    float(hi[j]),
+                "significant": not (lo[j] <= 0 <= hi[j]),
             }
-        else:
-            ci_result[pair] = {}
 
     return ci_result
 
@@ -521,17 +768,29 @@ try:
 except NameError:
     _ci_level = 0.95
 
+# Normal critical value for SE-based CIs, computed once per run
+_z_crit = scipy_stats.norm.ppf(1 - (1 - _ci_level) / 2)
+
 # missingValues
 try:
     _missing = str(missingValues).lower()  # noqa: F821
 except NameError:
     _missing = "exclude-listwise"
 
+# diagramLayout
+try:
+    _diagram_layout = str(diagramLayout).lower()  # noqa: F821
+except NameError:
+    _diagram_layout = "aos"
+
 # ---------------------------------------------------------------------------
 # Parse variables and build dataframe
 # ---------------------------------------------------------------------------
 
-_endo_vars, _exo_vars, _all_vars = _parse_model_variables(_model_syntax)
+_endo_vars, _exo_vars, _all_vars, _path_map = _parse_model_variables(_model_syntax)
+# Constant-time membership for the role checks below
+_endo_set = frozenset(_endo_vars)
+_exo_set  = frozenset(_exo_vars)
 
 if not _all_vars:
     raise ValueError("Could not identify any variables from the model syntax. Check the syntax format.")
@@ -542,14 +801,17 @@ _missing_cols = [v for v in _all_vars if v not in df.columns]
 if _missing_cols:
     raise ValueError(f"Variable(s) not found in data columns: {_missing_cols}")
 
-df_sub = df[_all_vars].copy()
-for _col in df_sub.columns:
-    df_sub[_col] = pd.to_numeric(df_sub[_col], errors="coerce")
+# Column selection already yields a new frame and nothing below mutates it,
+# so no defensive copies are taken here or for the FIML branch.
+df_sub = df[_all_vars]
+# Coerce in a single pass, and not at all when every column is already numeric
+if not all(pd.api.types.is_numeric_dtype(df_sub[_col]) for _col in df_sub.columns):
+    df_sub = df_sub.apply(pd.to_numeric, errors="coerce")
 
 _n_total = len(df_sub)
 
 if _missing == "fiml":
-    df_clean = df_sub.copy()
+    df_clean = df_sub
     _n = _n_total
 else:
     df_clean = df_sub.dropna()
@@ -577,18 +839,11 @@ try:
         df_clean, _model_syntax, _estimator, _do_std, _ci_level, _do_bootstrap, _n_boot
     )
     _r2_external = {}
-    # Try to extract R2 from semopy
-    try:
-        for _ev in _endo_vars:
-            _r2_val = semopy.calc_stats(_sem_result["model"])
-            # No standard R2 in semopy stats; compute from residual variance
-    except Exception:
-        pass
 except ImportError:
     _used_fallback = True
     _fallback_note = " (OLS fallback; install semopy for full SEM path analysis)"
     _sem_result = _run_ols_fallback(
-        df_clean, _endo_vars, _exo_vars, _all_vars, _model_syntax, _do_std, _ci_level
+        df_clean, _endo_vars, _exo_vars, _all_vars, _path_map, _do_std, _ci_level
     )
     _r2_external = _sem_result.get("r_squared", {})
 except Exception as _e:
@@ -603,6 +858,9 @@ if "lhs" in _params.columns and "lval" not in _params.columns:
 if "Estimate" not in _params.columns and "estimate" in _params.columns:
     _params = _params.rename(columns={"estimate": "Estimate"})
 
+# Standardized-estimate column (semopy "Est. Std" or fallback "std_estimate")
+_std_col = next((c for c in _params.columns if "std" in c.lower() and "err" not in c.lower()), None)
+
 # ---------------------------------------------------------------------------
 # Extract path coefficients
 # ---------------------------------------------------------------------------
@@ -610,65 +868,73 @@ if "Estimate" not in _params.columns and "estimate" in _params.columns:
 _reg_rows = _params[_params["op"] == "~"] if "op" in _params.columns else pd.DataFrame()
 
 _path_coefficients = []
-_z_crit = scipy_stats.norm.ppf(1 - (1 - _ci_level) / 2)
 
-for _, _row in _reg_rows.iterrows():
-    _est = _row.get("Estimate", _row.get("Est", None))
-    _se  = _row.get("Std. Err", _row.get("SE", None))
-    _z   = _row.get("z-value",  _row.get("z",  None))
-    _pv  = _row.get("p-value",  _row.get("p",  None))
-    _ci_l = _row.get("ci_lower", None)
-    _ci_u = _row.get("ci_upper", None)
-
-    if _est is None or (isinstance(_est, float) and np.isnan(_est)):
-        continue
+if not _reg_rows.empty:
+    # Pull whole columns once; the loop below only zips plain floats
+    _ests = _num_col(_reg_rows, "Estimate", "Est")
+    _ses  = _num_col(_reg_rows, "Std. Err", "SE")
+    _zs   = _num_col(_reg_rows, "z-value",  "z")
+    _pvs  = _num_col(_reg_rows, "p-value",  "p")
+    _ci_ls = _num_col(_reg_rows, "ci_lower")
+    _ci_us = _num_col(_reg_rows, "ci_upper")
+    _stds = _num_col(_reg_rows, _std_col) if _do_std and _std_col is not None \
+        else np.full(len(_reg_rows), np.nan)
 
     # Compute CI from SE if not directly available
-    if (_ci_l is None or pd.isna(_ci_l)) and _se is not None and not pd.isna(_se):
-        _ci_l = float(_est) - _z_crit * float(_se)
-        _ci_u = float(_est) + _z_crit * float(_se)
-
-    _entry = {
-        "from":      str(_row.get("rval", "")),
-        "to":        str(_row.get("lval", "")),
-        "estimate":  round(float(_est), 4),
-        "se":        round(float(_se),  4) if _se  is not None and not pd.isna(_se)  else None,
-        "z":         round(float(_z),   4) if _z   is not None and not pd.isna(_z)   else None,
-        "p_value":   round(float(_pv),  6) if _pv  is not None and not pd.isna(_pv)  else None,
-        "ci_lower":  round(float(_ci_l), 4) if _ci_l is not None and not pd.isna(_ci_l) else None,
-        "ci_upper":  round(float(_ci_u), 4) if _ci_u is not None and not pd.isna(_ci_u) else None,
-    }
-
-    # Standardised estimate
-    if _do_std:
-        _std_col = next((c for c in _params.columns if "std" in c.lower() and "err" not in c.lower()), None)
-        if _std_col is not None:
-            _sv = _row.get(_std_col, None)
-            if _sv is not None and not pd.isna(_sv):
-                _entry["std_estimate"] = round(float(_sv), 4)
-        elif "std_estimate" in _row:
-            _sv = _row["std_estimate"]
-            if _sv is not None and not pd.isna(_sv):
-                _entry["std_estimate"] = round(float(_sv), 4)
-
-    _path_coefficients.append(_entry)
+    _fill_ci = np.isnan(_ci_ls) & ~np.isnan(_ses)
+    _ci_ls = np.where(_fill_ci, _ests - _z_crit * _ses, _ci_ls)
+    _ci_us = np.where(_fill_ci, _ests + _z_crit * _ses, _ci_us)
+
+    # Rows without an estimate are dropped; every column is rounded in bulk
+    _keep = ~np.isnan(_ests)
+    for _from, _to, _est, _se, _z, _pv, _ci_l, _ci_u, _sv in zip(
+        _reg_rows["rval"].astype(str)[_keep], _reg_rows["lval"].astype(str)[_keep],
+        _round_list(_ests[_keep], 4), _round_list(_ses[_keep], 4),
+        _round_list(_zs[_keep], 4), _round_list(_pvs[_keep], 6),
+        _round_list(_ci_ls[_keep], 4), _round_list(_ci_us[_keep], 4),
+        _round_list(_stds[_keep], 4),
+    ):
+        _entry = {
+            "from":      _from,
+            "to":        _to,
+            "estimate":  _est,
+            "se":        _se,
+            "z":         _z,
+            "p_value":   _pv,
+            "ci_lower":  _ci_l,
+            "ci_upper":  _ci_u,
+        }
+        # Standardised estimate
+        if _sv is not None:
+            _entry["std_estimate"] = _sv
+        _path_coefficients.append(_entry)
 
 # ---------------------------------------------------------------------------
 # Indirect effects
 # ---------------------------------------------------------------------------
 
 _indirect_effects = None
+_n_sig_ind = 0  # significant bootstrap CIs, counted as they are attached
 
 try:
+    # Index the regression rows once; the mediator search is dict lookups
+    _coef_map: dict[tuple[str, str], tuple] = {}
+    _preds_by_outcome: dict[str, list[str]] = {}
+    _outcomes_by_pred: dict[str, list[str]] = {}
+    if not _reg_rows.empty:
+        _std_vals = _reg_rows[_std_col] if _std_col is not None else [None] * len(_reg_rows)
+        for _lval, _rval, _est, _sv in zip(
+            _reg_rows["lval"], _reg_rows["rval"], _reg_rows["Estimate"], _std_vals
+        ):
+            _coef_map[(_lval, _rval)] = (_est, _sv)
+        _preds_by_outcome = _reg_rows.groupby("lval", sort=False)["rval"].agg(list).to_dict()
+        _outcomes_by_pred = _reg_rows.groupby("rval", sort=False)["lval"].agg(list).to_dict()
+
     # Detect mediators: variables that appear as both predictor and outcome
-    _mediators_detected: list[str] = []
-    for _ev in _endo_vars:
-        _preds_of_e = [
-            _row["rval"] for _, _row in _reg_rows.iterrows() if _row["lval"] == _ev
-        ]
-        for _p in _preds_of_e:
-            if _p in _endo_vars and _p not in _mediators_detected:
-                _mediators_detected.append(_p)
+    # (dict keys keep first-seen order and dedupe in O(1))
+    _mediators_detected = list(dict.fromkeys(
+        _p for _ev in _endo_vars for _p in _preds_by_outcome.get(_ev, []) if _p in _endo_set
+    ))
 
     if _mediators_detected:
         _indirect_list = []
@@ -676,24 +942,21 @@ try:
 
         for _med in _mediators_detected:
             # X vars: predictors of mediator that are exogenous
-            _x_vars = [
-                _row["rval"] for _, _row in _reg_rows.iterrows()
-                if _row["lval"] == _med and _row["rval"] in _exo_vars
-            ]
+            _x_vars = [_r for _r in _preds_by_outcome.get(_med, []) if _r in _exo_set]
             # Y vars: outcomes of mediator that are endogenous (not itself)
             _y_vars = [
-                _row["lval"] for _, _row in _reg_rows.iterrows()
-                if _row["rval"] == _med and _row["lval"] in _endo_vars and _row["lval"] != _med
+                _l for _l in _outcomes_by_pred.get(_med, [])
+                if _l in _endo_set and _l != _med
             ]
 
             for _x_var in _x_vars:
                 for _y_var in _y_vars:
-                    _a_rows = _reg_rows[(_reg_rows["lval"] == _med) & (_reg_rows["rval"] == _x_var)]
-                    _b_rows = _reg_rows[(_reg_rows["lval"] == _y_var) & (_reg_rows["rval"] == _med)]
+                    _a_entry = _coef_map.get((_med, _x_var))
+                    _b_entry = _coef_map.get((_y_var, _med))
 
-                    if len(_a_rows) == 1 and len(_b_rows) == 1:
-                        _a = float(_a_rows.iloc[0]["Estimate"])
-                        _b = float(_b_rows.iloc[0]["Estimate"])
+                    if _a_entry is not None and _b_entry is not None:
+                        _a = float(_a_entry[0])
+                        _b = float(_b_entry[0])
                         _indirect_est = _a * _b
 
                         _ie = {
@@ -706,19 +969,12 @@ try:
                         }
 
                         # Standardized indirect
-                        if _do_std:
-                            _std_col = next(
-                                (c for c in _params.columns if "std" in c.lower() and "err" not in c.lower()),
-                                None
-                            )
-                            if _std_col is not None:
-                                _a_std_rows = _a_rows.copy()
-                                _b_std_rows = _b_rows.copy()
-                                _a_std = _a_std_rows.iloc[0].get(_std_col, None)
-                                _b_std = _b_std_rows.iloc[0].get(_std_col, None)
-                                if _a_std is not None and not pd.isna(_a_std) \
-                                        and _b_std is not None and not pd.isna(_b_std):
-                                    _ie["std_estimate"] = round(float(_a_std) * float(_b_std), 4)
+                        if _do_std and _std_col is not None:
+                            _a_std = _a_entry[1]
+                            _b_std = _b_entry[1]
+                            if _a_std is not None and not pd.isna(_a_std) \
+                                    and _b_std is not None and not pd.isna(_b_std):
+                                _ie["std_estimate"] = round(float(_a_std) * float(_b_std), 4)
 
                         _boot_pairs.append((_x_var, _med, _y_var))
                         _indirect_list.append(_ie)
@@ -726,7 +982,7 @@ try:
         # Bootstrap CIs if requested
         if _do_bootstrap and _boot_pairs:
             _boot_cis = _bootstrap_indirect(
-                df_clean, _model_syntax, _endo_vars, _exo_vars, _boot_pairs, _n_boot, _ci_level
+                df_clean, _path_map, _all_vars, _boot_pairs, _n_boot, _ci_level
             )
             for _ie in _indirect_list:
                 _pair = (_ie["from"], _ie["through"], _ie["to"])
@@ -735,6 +991,8 @@ try:
                 _ie["ci_lower"]   = round(_bci["ci_lower"], 4) if _bci.get("ci_lower") is not None else None
                 _ie["ci_upper"]   = round(_bci["ci_upper"], 4) if _bci.get("ci_upper") is not None else None
                 _ie["significant"] = _bci.get("significant", None)
+                if _ie["significant"] is True:
+                    _n_sig_ind += 1
 
         if _indirect_list:
             _indirect_effects = _indirect_list
@@ -749,64 +1007,53 @@ except Exception as _e_ind:
 _total_effects = None
 
 try:
-    _te_map: dict[str, dict] = {}
-    for _pc in _path_coefficients:
-        _key = f"{_pc['from']}->{_pc['to']}"
-        _direct_val    = _pc["estimate"]
-        _std_direct    = _pc.get("std_estimate", None)
-        _indirect_sum  = 0.0
-        _std_ind_sum   = 0.0
-        _has_std_ind   = False
-
-        if _indirect_effects:
-            for _ie in _indirect_effects:
-                if _ie["from"] == _pc["from"] and _ie["to"] == _pc["to"]:
-                    _indirect_sum += _ie["estimate"]
-                    if _ie.get("std_estimate") is not None:
-                        _std_ind_sum += _ie["std_estimate"]
-                        _has_std_ind = True
-
-        _te_entry = {
-            "from":     _pc["from"],
-            "to":       _pc["to"],
-            "direct":   round(_direct_val, 4),
-            "indirect": round(_indirect_sum, 4) if _indirect_sum != 0 else None,
-            "total":    round(_direct_val + _indirect_sum, 4),
+    # One row per direct path and per indirect route; a single groupby-sum on
+    # (from, to) then yields direct, indirect and total for every pair.
+    _eff_rows = [
+        {
+            "from":         _pc["from"],
+            "to":           _pc["to"],
+            "direct":       _pc["estimate"],
+            "indirect":     np.nan,
+            "std_direct":   _pc.get("std_estimate", np.nan),
+            "std_indirect": np.nan,
         }
-        if _do_std and _std_direct is not None:
-            _te_entry["std_direct"]   = _std_direct
-            _te_entry["std_indirect"] = round(_std_ind_sum, 4) if _has_std_ind else None
-            _te_entry["std_total"]    = round(
-                (_std_direct or 0) + (_std_ind_sum if _has_std_ind else 0), 4
-            )
-        _te_map[_key] = _te_entry
+        for _pc in _path_coefficients
+    ] + [
+        {
+            "from":         _ie["from"],
+            "to":           _ie["to"],
+            "direct":       np.nan,
+            "indirect":     _ie["estimate"],
+            "std_direct":   np.nan,
+            "std_indirect": _ie.get("std_estimate", np.nan),
+        }
+        for _ie in (_indirect_effects or [])
+    ]
 
-    # Indirect-only pairs (no direct path)
-    if _indirect_effects:
-        for _ie in _indirect_effects:
-            _key = f"{_ie['from']}->{_ie['to']}"
-            if _key not in _te_map:
-                _te_entry = {
-                    "from":     _ie["from"],
-                    "to":       _ie["to"],
-                    "direct":   0.0,
-                    "indirect": round(_ie["estimate"], 4),
-                    "total":    round(_ie["estimate"], 4),
-                }
-                if _do_std and _ie.get("std_estimate") is not None:
-                    _te_entry["std_direct"]   = 0.0
-                    _te_entry["std_indirect"] = round(_ie["std_estimate"], 4)
-                    _te_entry["std_total"]    = round(_ie["std_estimate"], 4)
-                _te_map[_key] = _te_entry
-            else:
-                # Accumulate if already exists
-                _existing = _te_map[_key]
-                _prev_ind = _existing.get("indirect") or 0.0
-                _new_ind  = _prev_ind + _ie["estimate"]
-                _te_map[_key]["indirect"] = round(_new_ind, 4)
-                _te_map[_key]["total"]    = round(_existing["direct"] + _new_ind, 4)
-
-    _total_effects = list(_te_map.values()) if _te_map else None
+    if _eff_rows:
+        # min_count=1 keeps "no such effect" as NaN instead of 0
+        _agg = pd.DataFrame(_eff_rows).groupby(
+            ["from", "to"], sort=False, as_index=False
+        ).sum(min_count=1)
+        _agg["total"]     = _agg["direct"].fillna(0) + _agg["indirect"].fillna(0)
+        _agg["std_total"] = _agg["std_direct"].fillna(0) + _agg["std_indirect"].fillna(0)
+        _agg = _agg.round(4)
+
+        _total_effects = []
+        for _rec in _agg.to_dict("records"):
+            _te_entry = {
+                "from":     _rec["from"],
+                "to":       _rec["to"],
+                "direct":   0.0 if pd.isna(_rec["direct"]) else _rec["direct"],
+                "indirect": None if pd.isna(_rec["indirect"]) else _rec["indirect"],
+                "total":    _rec["total"],
+            }
+            if _do_std and not (pd.isna(_rec["std_direct"]) and pd.isna(_rec["std_indirect"])):
+                _te_entry["std_direct"]   = 0.0 if pd.isna(_rec["std_direct"]) else _rec["std_direct"]
+                _te_entry["std_indirect"] = None if pd.isna(_rec["std_indirect"]) else _rec["std_indirect"]
+                _te_entry["std_total"]    = _rec["std_total"]
+            _total_effects.append(_te_entry)
 
 except Exception as _e_te:
     warnings.warn(f"Total effects computation failed: {_e_te}")
@@ -856,21 +1103,40 @@ try:
     if _r2_external:
         _r_squared = {k: round(float(v), 4) for k, v in _r2_external.items() if v is not None}
     elif not _used_fallback and _sem_result.get("model") is not None:
-        # Compute R2 from semopy inspect or manually
-        _r2_dict_tmp: dict[str, float] = {}
-        for _ev in _endo_vars:
-            _y_vals = df_clean[_ev].values
-            _y_pred_rows = _path_coefficients
-            # Reconstruct predicted values from direct predictors
-            _ev_preds = [pc for pc in _path_coefficients if pc["to"] == _ev]
-            if _ev_preds:
-                _y_pred = np.zeros(len(df_clean))
-                for _pc in _ev_preds:
-                    if _pc["from"] in df_clean.columns:
-                        _y_pred += _pc["estimate"] * df_clean[_pc["from"]].values
-                _ss_res = np.sum((_y_vals - _y_pred) ** 2)
-                _ss_tot = np.sum((_y_vals - np.mean(_y_vals)) ** 2)
-                _r2_dict_tmp[_ev] = round(float(1 - _ss_res / _ss_tot), 4) if _ss_tot > 0 else 0.0
+        # Compute R2 manually from the estimated structural coefficients.
+        # B (predictors x endogenous) holds every equation, so one GEMM gives
+        # all predictions. Columns are centred, which stands in for the
+        # intercepts the structural equations do not report.
+        _cols = frozenset(df_clean.columns)
+        _pred_idx = {
+            _v: _i for _i, _v in enumerate(dict.fromkeys(
+                _pc["from"] for _pc in _path_coefficients if _pc["from"] in _cols
+            ))
+        }
+        _endo_idx = {_v: _j for _j, _v in enumerate(_endo_vars)}
+        _B = np.zeros((len(_pred_idx), len(_endo_vars)))
+        _has_preds = np.zeros(len(_endo_vars), dtype=bool)
+        for _pc in _path_coefficients:
+            _j = _endo_idx.get(_pc["to"])
+            if _j is None:
+                continue
+            _has_preds[_j] = True
+            _i = _pred_idx.get(_pc["from"])
+            if _i is not None:
+                _B[_i, _j] += _pc["estimate"]
+        _Y_dev = df_clean[_endo_vars].to_numpy(dtype=np.float64)
+        _Y_dev = _Y_dev - _Y_dev.mean(axis=0)
+        _X_dev = df_clean[list(_pred_idx)].to_numpy(dtype=np.float64)
+        _X_dev = _X_dev - _X_dev.mean(axis=0)
+        _resid = _Y_dev - _X_dev @ _B
+        _ss_res = np.einsum("ij,ij->j", _resid, _resid)
+        _ss_tot = np.einsum("ij,ij->j", _Y_dev, _Y_dev)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _r2_all = np.where(_ss_tot > 0, 1 - _ss_res / _ss_tot, 0.0)
+        _r2_dict_tmp = dict(zip(
+            [_v for _v, _h in zip(_endo_vars, _has_preds) if _h],
+            np.round(_r2_all[_has_preds], 4).tolist(),
+        ))
         if _r2_dict_tmp:
             _r_squared = _r2_dict_tmp
 except Exception:
@@ -890,15 +1156,16 @@ try:
 
     if not _rv_rows.empty:
         _rv_dict: dict[str, dict] = {}
-        for _, _row in _rv_rows.iterrows():
-            _vname = str(_row["lval"])
-            _est = _row.get("Estimate", None)
-            _se  = _row.get("Std. Err", None)
-            _pv  = _row.get("p-value", None)
+        for _vname, _est, _se, _pv in zip(
+            _rv_rows["lval"].astype(str),
+            _round_list(_num_col(_rv_rows, "Estimate"), 4),
+            _round_list(_num_col(_rv_rows, "Std. Err"), 4),
+            _round_list(_num_col(_rv_rows, "p-value"),  6),
+        ):
             _rv_dict[_vname] = {
-                "estimate": round(float(_est), 4) if _est is not None and not pd.isna(_est) else None,
-                "se":       round(float(_se),  4) if _se  is not None and not pd.isna(_se)  else None,
-                "p_value":  round(float(_pv),  6) if _pv  is not None and not pd.isna(_pv)  else None,
+                "estimate": _est,
+                "se":       _se,
+                "p_value":  _pv,
             }
         _residual_variances = _rv_dict if _rv_dict else None
 except Exception:
@@ -908,73 +1175,83 @@ except Exception:
 # Diagram data
 # ---------------------------------------------------------------------------
 
-_diagram = None
-try:
-    _nodes = [
-        {
-            "id":    v,
-            "label": v,
-            "type":  "endogenous" if v in _endo_vars else "exogenous",
-        }
-        for v in _all_vars
-    ]
-    _edges = [
-        {
-            "from":        _pc["from"],
-            "to":          _pc["to"],
-            "estimate":    _pc["estimate"],
-            "p_value":     _pc.get("p_value"),
-            "significant": _pc.get("p_value") is not None and _pc["p_value"] < 0.05,
-            **({"std_estimate": _pc["std_estimate"]} if "std_estimate" in _pc else {}),
-        }
-        for _pc in _path_coefficients
-    ]
-    _diagram = {"nodes": _nodes, "edges": _edges}
-except Exception:
-    _diagram = None
+def _build_diagram() -> dict | None:
+    try:
+        nodes = [
+            {
+                "id":    v,
+                "label": v,
+                "type":  "endogenous" if v in _endo_set else "exogenous",
+            }
+            for v in _all_vars
+        ]
+        edges = [
+            {
+                "from":        pc["from"],
+                "to":          pc["to"],
+                "estimate":    pc["estimate"],
+                "p_value":     pc.get("p_value"),
+                "significant": pc.get("p_value") is not None and pc["p_value"] < 0.05,
+                **({"std_estimate": pc["std_estimate"]} if "std_estimate" in pc else {}),
+            }
+            for pc in _path_coefficients
+        ]
+        if _diagram_layout == "columns":
+            # One list per field instead of a dict per node/edge: smaller to
+            # encode and what column-oriented renderers iterate anyway
+            node_cols = {k: [nd[k] for nd in nodes] for k in ("id", "label", "type")}
+            edge_cols = {
+                k: [e[k] for e in edges]
+                for k in ("from", "to", "estimate", "p_value", "significant")
+            }
+            if any("std_estimate" in e for e in edges):
+                edge_cols["std_estimate"] = [e.get("std_estimate") for e in edges]
+            nodes, edges = node_cols, edge_cols
+        return {"nodes": nodes, "edges": edges}
+    except Exception:
+        return None
 
 # ---------------------------------------------------------------------------
 # Interpretation
 # ---------------------------------------------------------------------------
 
-_n_paths      = len(_path_coefficients)
-_n_endo       = len(_endo_vars)
-_n_exo        = len(_exo_vars)
-_sig_paths    = sum(
-    1 for _pc in _path_coefficients
-    if _pc.get("p_value") is not None and _pc["p_value"] < 0.05
-)
-
-_fit_interp_str = (
-    _fit_indices_out.get("fit_interpretation", "Fit indices unavailable")
-    if _fit_indices_out else "Fit indices unavailable"
-)
-
-_r2_parts = []
-if _r_squared:
-    for _v, _r2v in _r_squared.items():
-        if _r2v is not None:
-            _r2_parts.append(f"{_v}: R\u00b2 = {_r2v:.3f} ({_r2v * 100:.1f}% variance explained)")
-
-_indirect_str = ""
-if _indirect_effects:
-    _n_sig_ind = sum(1 for _ie in _indirect_effects if _ie.get("significant") is True)
-    _indirect_str = (
-        f" {len(_indirect_effects)} indirect effect(s) identified"
-        + (f"; {_n_sig_ind} significant via bootstrapping." if _do_bootstrap else ".")
+def _build_interpretation() -> str:
+    n_paths = len(_path_coefficients)
+    # Missing p-values become NaN, which never compares below .05
+    path_pv = np.fromiter(
+        (np.nan if pc.get("p_value") is None else pc["p_value"] for pc in _path_coefficients),
+        dtype=np.float64, count=n_paths,
+    )
+    sig_paths = int(np.count_nonzero(path_pv < 0.05))
+
+    fit_interp_str = (
+        _fit_indices_out.get("fit_interpretation", "Fit indices unavailable")
+        if _fit_indices_out else "Fit indices unavailable"
     )
 
-_interp_parts = [
-    f"Path analysis{_fallback_note} (estimator: {_estimator}). N = {_n}. "
-    f"Model: {_n_endo} endogenous variable(s) ({', '.join(_endo_vars)}), "
-    f"{_n_exo} exogenous variable(s) ({', '.join(_exo_vars) if _exo_vars else 'none'}).",
-    f"{_sig_paths} of {_n_paths} direct path(s) statistically significant (p < .05).{_indirect_str}",
-    _fit_interp_str,
-]
-if _r2_parts:
-    _interp_parts.append("Variance explained: " + "; ".join(_r2_parts))
+    r2_str = "; ".join(
+        f"{v}: R\u00b2 = {r2v:.3f} ({r2v * 100:.1f}% variance explained)"
+        for v, r2v in (_r_squared or {}).items() if r2v is not None
+    )
+
+    indirect_str = ""
+    if _indirect_effects:
+        indirect_str = (
+            f" {len(_indirect_effects)} indirect effect(s) identified"
+            + (f"; {_n_sig_ind} significant via bootstrapping." if _do_bootstrap else ".")
+        )
+
+    parts = [
+        f"Path analysis{_fallback_note} (estimator: {_estimator}). N = {_n}. "
+        f"Model: {len(_endo_vars)} endogenous variable(s) ({', '.join(_endo_vars)}), "
+        f"{len(_exo_vars)} exogenous variable(s) ({', '.join(_exo_vars) if _exo_vars else 'none'}).",
+        f"{sig_paths} of {n_paths} direct path(s) statistically significant (p < .05).{indirect_str}",
+        fit_interp_str,
+    ]
+    if r2_str:
+        parts.append("Variance explained: " + r2_str)
 
-interpretation = " ".join(_interp_parts)
+    return " ".join(parts)
 
 # ---------------------------------------------------------------------------
 # Compose result
@@ -992,10 +1269,10 @@ result = {
     "fit_indices":         _fit_indices_out,
     "r_squared":           _r_squared,
     "residual_variances":  _residual_variances,
-    "diagram":             _diagram,
+    "diagram":             _build_diagram(),
     "standardized":        _do_std,
     "bootstrap":           _do_bootstrap,
     "n_boot":              _n_boot if _do_bootstrap else None,
     "ci_level":            _ci_level,
-    "interpretation":      interpretation,
+    "interpretation":      _build_interpretation(),
 }
@@ -68,9 +68,12 @@ Result structure
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
+from scipy import linalg as scipy_linalg
 from scipy import stats as scipy_stats
 
 
@@ -84,13 +87,24 @@ def _coerce(x) -> np.ndarray:
 
 
 def _vif_series(X_df: pd.DataFrame) -> list[dict]:
-    """Compute Variance Inflation Factor for each column of X_df (no constant)."""
-    from statsmodels.stats.outliers_influence import variance_inflation_factor
-    results = []
-    for i, col in enumerate(X_df.columns):
-        v = variance_inflation_factor(X_df.values, i)
-        results.append({"term": col, "vif": round(float(v), 4)})
-    return results
+    """
+    Compute Variance Inflation Factor for each column of X_df (no constant).
+
+    VIF_i is the i-th diagonal element of the inverse correlation matrix,
+    so a single k x k inversion replaces k auxiliary regressions.
+    """
+    X = X_df.to_numpy(dtype=np.float64)
+    try:
+        vifs = np.diag(np.linalg.inv(np.corrcoef(X, rowvar=False)))
+    except np.linalg.LinAlgError:
+        # Singular correlation matrix: fall back to one auxiliary OLS per column
+        from statsmodels.stats.outliers_influence import variance_inflation_factor
+        exog = sm.add_constant(X, has_constant="add")
+        vifs = [variance_inflation_factor(exog, i + 1) for i in range(X.shape[1])]
+    return [
+        {"term": col, "vif": v}
+        for col, v in zip(X_df.columns, np.round(np.asarray(vifs, dtype=np.float64), 4).tolist())
+    ]
 
 
 def _shapiro(resids: np.ndarray, alpha: float) -> dict:
@@ -103,13 +117,77 @@ def _shapiro(resids: np.ndarray, alpha: float) -> dict:
     }
 
 
+def _fit_ols_qr(X: np.ndarray, Y: np.ndarray):
+    """
+    Least squares through one thin QR factorization: beta = R^-1 Q'Y.
+    Returns (params, resid, R), or (None, None, R) when X is rank-deficient.
+    """
+    Q, R = np.linalg.qr(X)
+    diag = np.abs(np.diag(R))
+    if diag.size == 0 or diag.min() <= diag.max() * max(X.shape) * np.finfo(np.float64).eps:
+        return None, None, R
+    params = scipy_linalg.solve_triangular(R, Q.T @ Y)
+    return params, Y - X @ params, R
+
+
+def _fit_ols_fast(Y: np.ndarray, X: np.ndarray, k_constant: int):
+    """
+    Closed-form OLS exposing the subset of statsmodels' RegressionResults
+    attributes used below. Returns None for rank-deficient designs so the
+    caller can defer to statsmodels' pseudo-inverse handling.
+    """
+    n, p = X.shape
+    params, resid, R = _fit_ols_qr(X, Y)
+    if params is None:
+        return None
+
+    ssr = float(resid @ resid)
+    dev = Y - Y.mean()
+    centered_tss = float(dev @ dev)
+    tss = centered_tss if k_constant else float(Y @ Y)
+    ess = tss - ssr
+    df_model = p - k_constant
+    df_resid = n - p
+    mse_resid = ssr / df_resid
+    rsquared = 1 - ssr / tss
+
+    # diag((X'X)^-1) = row sums of squares of R^-1, since X'X = R'R
+    R_inv = scipy_linalg.solve_triangular(R, np.eye(p))
+    bse = np.sqrt((R_inv ** 2).sum(axis=1) * mse_resid)
+    tvalues = params / bse
+    fvalue = (ess / df_model) / mse_resid if df_model > 0 else np.nan
+    llf = -n / 2 * (np.log(2 * np.pi) + np.log(ssr / n) + 1)
+
+    return SimpleNamespace(
+        params=params,
+        bse=bse,
+        tvalues=tvalues,
+        pvalues=2 * scipy_stats.t.sf(np.abs(tvalues), df_resid),
+        resid=resid,
+        nobs=float(n),
+        df_model=float(df_model),
+        df_resid=float(df_resid),
+        ssr=ssr,
+        ess=ess,
+        centered_tss=centered_tss,
+        rsquared=rsquared,
+        rsquared_adj=1 - (n - k_constant) / df_resid * (1 - rsquared),
+        mse_resid=mse_resid,
+        fvalue=fvalue,
+        f_pvalue=scipy_stats.f.sf(fvalue, df_model, df_resid),
+        aic=-2 * llf + 2 * p,
+        bic=-2 * llf + np.log(n) * p,
+    )
+
+
 def _anova_table(fit_result) -> list[dict]:
     """Build a simple ANOVA decomposition from an OLS fit result."""
     n    = int(fit_result.nobs)
     k    = int(fit_result.df_model)     # regression df (excl. constant)
     df_r = int(fit_result.df_resid)
 
-    ss_total = float(np.sum((fit_result.model.endog - np.mean(fit_result.model.endog)) ** 2))
+    # The fit already carries the centred total sum of squares
+    ss_total = float(fit_result.centered_tss)
     ss_resid = float(fit_result.ssr)
     ss_reg   = float(fit_result.ess)
 
@@ -194,26 +272,28 @@ for _nm in _indep_names:
         raise ValueError(f"Column '{_nm}' not found in data")
 
 # ---------------------------------------------------------------------------
-# Build clean DataFrame from data dictionary
+# Build clean design data from data dictionary
 # ---------------------------------------------------------------------------
 
-_frame_data: dict[str, np.ndarray] = {_dep_name: _coerce(_data[_dep_name])}
-for _nm in _indep_names:
-    _frame_data[_nm] = _coerce(_data[_nm])
-
-_df = pd.DataFrame(_frame_data).dropna()
-_n = len(_df)
+# One (n, 1 + k) matrix: dependent first, then predictors in slot order
+_raw = np.column_stack([_coerce(_data[_nm]) for _nm in [_dep_name, *_indep_names]])
+_clean = _raw[~np.isnan(_raw).any(axis=1)]
+_n = _clean.shape[0]
 
 if _n < _k + 2:
     raise ValueError(
         f"Insufficient complete observations (n={_n}) for {_k} predictor(s)."
     )
 
-_Y = _df[_dep_name].values
-_X_raw = _df[_indep_names].values  # shape (n, k), no constant yet
+_Y = _clean[:, 0]
+_X_raw = _clean[:, 1:]  # shape (n, k), no constant yet
 
 if _include_constant:
-    _X = sm.add_constant(_X_raw, has_constant="add")
+    # Fill the intercept column in place rather than concatenating a new
+    # array; column-major layout is what LAPACK's QR works on natively
+    _X = np.empty((_n, _k + 1), dtype=np.float64, order="F")
+    _X[:, 0] = 1.0
+    _X[:, 1:] = _X_raw
     _const_col = ["const"] + _indep_names
 else:
     _X = _X_raw
@@ -223,26 +303,50 @@ else:
 # Fit OLS
 # ---------------------------------------------------------------------------
 
-_fit = sm.OLS(_Y, _X).fit()
+# Small problems skip statsmodels' results machinery; its wrapper overhead
+# dominates there. Large or rank-deficient designs still go through sm.OLS.
+_fit = None
+if _n * (_k + 1) < 100_000:
+    _fit = _fit_ols_fast(_Y, _X, 1 if _include_constant else 0)
+if _fit is None:
+    _fit = sm.OLS(_Y, _X).fit()
 
 # ---------------------------------------------------------------------------
 # Coefficients table
 # ---------------------------------------------------------------------------
 
+# Pull every statistic as a vector once and round in bulk; tolist() yields
+# plain Python floats so the dicts below need no per-cell conversion.
+_params = np.asarray(_fit.params, dtype=np.float64)
+_bse    = np.asarray(_fit.bse, dtype=np.float64)
+_tvals  = np.asarray(_fit.tvalues, dtype=np.float64)
+_pvals  = np.asarray(_fit.pvalues, dtype=np.float64)
+
+# One critical t for every coefficient: params +/- t_crit * bse
 _alpha_val = 1 - _confidence_level
-_ci = _fit.conf_int(alpha=_alpha_val)  # (lower, upper) per param
+_t_crit    = scipy_stats.t.isf(_alpha_val / 2, _fit.df_resid)
+_ci_half   = _t_crit * _bse
 
-_coef_list = []
-for i, term in enumerate(_const_col):
-    _coef_list.append({
+_coef_list = [
+    {
         "term":      term,
-        "estimate":  round(float(_fit.params[i]),    6),
-        "std_error": round(float(_fit.bse[i]),        6),
-        "t_value":   round(float(_fit.tvalues[i]),    6),
-        "p_value":   round(float(_fit.pvalues[i]),    8),
-        "ci_lower":  round(float(_ci[i, 0]),           6),
-        "ci_upper":  round(float(_ci[i, 1]),           6),
-    })
+        "estimate":  est,
+        "std_error": se,
+        "t_value":   t,
+        "p_value":   p,
+        "ci_lower":  lo,
+        "ci_upper":  hi,
+    }
+    for term, est, se, t, p, lo, hi in zip(
+        _const_col,
+        np.round(_params, 6).tolist(),
+        np.round(_bse,    6).tolist(),
+        np.round(_tvals,  6).tolist(),
+        np.round(_pvals,  8).tolist(),
+        np.round(_params - _ci_half, 6).tolist(),
+        np.round(_params + _ci_half, 6).tolist(),
+    )
+]
 
 # ---------------------------------------------------------------------------
 # Model fit statistics
@@ -279,7 +383,7 @@ if 3 <= len(_resids) <= 5000:
 
 _vif_result = None
 if _run_diagnostics and _k >= 2:
-    _vif_result = _vif_series(_df[_indep_names])
+    _vif_result = _vif_series(pd.DataFrame(_X_raw, columns=_indep_names, copy=False))
 
 # ---------------------------------------------------------------------------
 # Interpretation
@@ -26,6 +26,8 @@ Expected namespace variables (injected by engine):
     nBoot       : int    Number of bootstrap samples (default 5000).
     ciLevel     : float  CI level, e.g. 0.95 (default 0.95).
     standardize : bool   Standardize all variables before analysis (default False).
+    ciMethod    : str    Bootstrap CI type: "percentile" (default) or "bca"
+                         (bias-corrected and accelerated, via the jackknife).
     effectSize  : bool   Reserved for future use (default True).
     totalEffect : bool   Include total effect (path c) in output (default True).
 
@@ -68,7 +70,8 @@ Result structure
     "ci_upper": float | null,
     "significant": bool | null
   },
-  "direct": {"effect": float, "se": float, "t": float, "p": float},
+  "direct": {"effect": float, "se": float, "t": float, "p": float,
+             "boot_ci_lower": float | null, "boot_ci_upper": float | null},
   "total":  {"effect": float, "se": float, "t": float, "p": float} | null,
   "model_summary": {
     "r_squared_y": float,
@@ -80,53 +83,144 @@ Result structure
   "standardized": bool,
   "ci_level": float,
   "n_boot": int | null,
+  "ci_method": "percentile" | "bca" | null,
   "interpretation": str
 }
 """
 
 from __future__ import annotations
 
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from itertools import combinations
+from types import SimpleNamespace
 from typing import Any
 
 import numpy as np
-import pandas as pd
 import statsmodels.api as sm
+from scipy import linalg as scipy_linalg
+from scipy import stats as scipy_stats
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _coerce(x) -> np.ndarray:
-    return np.array(x, dtype=float)
+def _fit_ols(X: np.ndarray, y: np.ndarray):
+    """
+    OLS through one thin QR factorization of X (which includes the constant),
+    exposing the statsmodels result attributes used below. Rank-deficient
+    designs are left to sm.OLS and its pseudo-inverse.
+    """
+    n, p = X.shape
+    Q, R = np.linalg.qr(X)
+    diag = np.abs(np.diag(R))
+    if diag.min() <= diag.max() * max(n, p) * np.finfo(np.float64).eps:
+        return sm.OLS(y, X).fit()
+    params = scipy_linalg.solve_triangular(R, Q.T @ y)
+    resid  = y - X @ params
+    df_resid = n - p
+    # diag((X'X)^-1) = row sums of squares of R^-1, since X'X = R'R
+    R_inv = scipy_linalg.solve_triangular(R, np.eye(p))
+    bse   = np.sqrt((R_inv ** 2).sum(axis=1) * (resid @ resid) / df_resid)
+    tvalues = params / bse
+    dev = y - y.mean()
+    rsquared = 1 - (resid @ resid) / (dev @ dev)
+    return SimpleNamespace(
+        params=params,
+        bse=bse,
+        tvalues=tvalues,
+        pvalues=2 * scipy_stats.t.sf(np.abs(tvalues), df_resid),
+        rsquared=rsquared,
+        rsquared_adj=1 - (n - 1) / df_resid * (1 - rsquared),
+    )
+
+
+def _coef_table(fit_result) -> np.ndarray:
+    """
+    Stack a fit's params, bse, tvalues and pvalues into one (4, p) array,
+    reading each result attribute once.
+    """
+    return np.vstack([
+        fit_result.params, fit_result.bse, fit_result.tvalues, fit_result.pvalues,
+    ])
+
+
+def _pack(table: np.ndarray, idx: int) -> dict:
+    """
+    Coefficient info at parameter position idx of a _coef_table, unrounded;
+    _rounded applies the output precision when the result is composed.
+    """
+    coef, se, t, p = table[:, idx].tolist()
+    return {"coef": coef, "se": se, "t": t, "p": p}
 
 
-def _extract_coef_by_idx(fit_result, idx: int) -> dict:
-    """Extract coefficient info at parameter position idx."""
+def _rounded(entry: dict) -> dict:
+    """Copy of a coefficient dict rounded for output (p to 8 places, else 6)."""
     return {
-        "coef": round(float(fit_result.params[idx]),  6),
-        "se":   round(float(fit_result.bse[idx]),     6),
-        "t":    round(float(fit_result.tvalues[idx]), 6),
-        "p":    round(float(fit_result.pvalues[idx]), 8),
+        key: val if val is None or key not in ("coef", "se", "t", "p")
+        else round(val, 8 if key == "p" else 6)
+        for key, val in entry.items()
     }
 
 
-def _extract_coef_by_name(fit_result, name: str, rhs_list: list[str]) -> dict:
+def _pack_by_name(table: np.ndarray, name: str, rhs_list: list[str]) -> dict:
     """
-    Extract coefficient for variable `name` from an OLS result where the RHS
+    Coefficient info for variable `name` from a _coef_table where the RHS
     columns were constructed as [const] + rhs_list.
     Returns None-valued dict if name not found.
     """
     if name not in rhs_list:
         return {"coef": None, "se": None, "t": None, "p": None}
     idx = rhs_list.index(name) + 1  # +1 for intercept
-    return _extract_coef_by_idx(fit_result, idx)
+    return _pack(table, idx)
+
+
+def _fast_ols(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Least-squares coefficients only. Like sm.OLS (pinv), a rank-deficient X
+    yields the minimum-norm solution rather than an error; LAPACK's gelsy
+    (complete orthogonal decomposition) gets there without a full SVD.
+    """
+    return scipy_linalg.lstsq(X, y, lapack_driver="gelsy", check_finite=False)[0]
+
+
+def _chain_effects(a: np.ndarray, d_next: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Indirect effects of every contiguous mediator chain at once.
+
+    a and b hold the X -> Mi and Mi -> Y paths (..., k); d_next holds the
+    consecutive paths d_(i,i+1) (..., k - 1). Entry [..., i, j] (i <= j) of
+    the result is a_i * d_(i,i+1) * ... * d_(j-1,j) * b_j; chains starting
+    at Mi share one cumulative product of the d paths. The lower triangle
+    is zero.
+    """
+    k = a.shape[-1]
+    out = np.zeros(a.shape + (k,))
+    for i in range(k):
+        cum_d = np.cumprod(
+            np.concatenate([np.ones(a.shape[:-1] + (1,)), d_next[..., i:]], axis=-1), axis=-1
+        )
+        out[..., i, i:] = a[..., i, None] * cum_d * b[..., i:]
+    return out
+
+
+def _indirect_paths_int(k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (starts, lengths) of all contiguous ordered sub-chains of k
+    mediators, shortest first. A chain covers mediator indices
+    starts[j] .. starts[j] + lengths[j] - 1, so its effect is entry
+    [start, start + length - 1] of the _chain_effects matrix.
+    """
+    lengths = np.repeat(np.arange(1, k + 1), np.arange(k, 0, -1))
+    starts = np.concatenate([np.arange(k - length + 1) for length in range(1, k + 1)])
+    return starts, lengths
 
 
 def _indirect_paths(mediators: list[str]) -> list[list[str]]:
     """
-    Return all contiguous ordered sub-chains of mediators (length >= 1).
+    Return all contiguous ordered sub-chains of mediators (length >= 1),
+    in the order of _indirect_paths_int.
 
     For mediators [M1, M2, M3] this yields:
       [M1], [M2], [M3],
@@ -135,131 +229,262 @@ def _indirect_paths(mediators: list[str]) -> list[list[str]]:
 
     Each sub-chain represents an indirect route X -> chain[0] -> ... -> chain[-1] -> Y.
     """
-    k = len(mediators)
-    paths = []
-    for length in range(1, k + 1):
-        for start in range(k - length + 1):
-            paths.append(mediators[start : start + length])
-    return paths
+    starts, lengths = _indirect_paths_int(len(mediators))
+    return [mediators[s : s + l] for s, l in zip(starts.tolist(), lengths.tolist())]
 
 
 # ---------------------------------------------------------------------------
 # Bootstrap engine
 # ---------------------------------------------------------------------------
 
+# Replicates whose resamples are processed together
+_BOOT_BLOCK = 256
+
+# Unlike path_analysis there is no numba kernel here: the row-count GEMM
+# below already keeps the per-replicate work out of Python, and a JIT loop
+# over resampled rows measured ~4x slower than it, before paying the few
+# seconds of compilation an exec'd script cannot cache.
+
+# From this many replicates on, bootstrap draws are stored as float32: the
+# rounding is far below the Monte Carlo error, and the percentile sort and
+# SE pass over half the bytes
+_BOOT_F32_MIN = 20_000
+
+# Cap on the elements of one block's (replicates, n) row-count matrix
+# (~32 MB in float64); large samples use smaller blocks
+_WEIGHT_MAX_ELEMS = 4_000_000
+
+
+def _solve_moments(G: np.ndarray, cols: list[int], target: int) -> np.ndarray:
+    """
+    OLS coefficients of column `target` on columns `cols` for every
+    replicate, given stacked cross-product matrices G (n_rep, q, q) of
+    mean-centred columns (slopes are unchanged by centring; intercepts are
+    not used).
+
+    X'X is first scaled to a unit diagonal, so the rank test below does not
+    depend on the units of the variables. Its eigenvalues are the squared
+    singular values of the (scaled) design, and a replicate counts as
+    rank-deficient when the smallest is within p * eps of the largest: the
+    normal equations cannot resolve it in double precision. Those go through
+    _fast_ols, which returns a minimum-norm solution as sm.OLS does;
+    the rest are solved in one batched call.
+    """
+    sel = np.asarray(cols)
+    xtx = G[:, sel[:, None], sel]
+    xty = G[:, sel, target]
+    diag = np.diagonal(xtx, axis1=1, axis2=2)
+    scale = 1.0 / np.sqrt(np.where(diag > 0, diag, 1.0))  # constant columns stay 0
+    xtx = xtx * scale[:, :, None] * scale[:, None, :]
+    xty = xty * scale
+    eig = np.linalg.eigvalsh(xtx)             # ascending, per replicate
+    full_rank = eig[:, 0] > eig[:, -1] * len(sel) * np.finfo(np.float64).eps
+    if full_rank.all():
+        return np.linalg.solve(xtx, xty[..., None])[..., 0] * scale
+    out = np.empty_like(xty)
+    out[full_rank] = np.linalg.solve(xtx[full_rank], xty[full_rank][..., None])[..., 0]
+    for r in np.flatnonzero(~full_rank):
+        out[r] = _fast_ols(xtx[r], xty[r])
+    return out * scale
+
+
 def _run_bootstrap(
-    df: pd.DataFrame,
+    data_np: np.ndarray,
+    col_ix: dict[str, int],
     pred: str,
     mediators: list[str],
     outcome: str,
     covs: list[str],
     n_boot: int,
     rng: np.random.Generator,
-) -> dict[str, np.ndarray]:
+    jackknife: bool = False,
+) -> tuple[dict[str, np.ndarray], dict[str, tuple[float, np.ndarray]] | None]:
     """
     Bootstrap all indirect paths simultaneously.
 
-    Returns a dict mapping path_label -> array of bootstrap estimates.
+    data_np is one float64 matrix whose column 0 is the constant; col_ix
+    maps the analysis column names to their positions in it.
+    Returns a dict mapping path_label -> array of bootstrap estimates and,
+    when jackknife is set (for BCa intervals), a dict mapping path_label ->
+    (full-sample estimate, leave-one-out estimates); otherwise None.
     """
     k    = len(mediators)
-    n    = len(df)
+    n    = len(data_np)
     paths = _indirect_paths(mediators)
-
-    # Allocate storage
-    boot_storage: dict[str, list[float]] = {
-        "_".join(p): [] for p in paths
-    }
-    boot_storage["__total__"] = []
-
-    for _ in range(n_boot):
-        idx = rng.integers(0, n, size=n)
-        d   = df.iloc[idx].reset_index(drop=True)
-
-        try:
-            # -----------------------------------------------------------------
-            # Re-fit all regression models on the resample
-            # -----------------------------------------------------------------
-
-            # a_i: X -> Mi  (for each mediator, controlling only prior mediators)
-            # Serial mediation regressions:
-            #   M1 ~ X  (+ covs)
-            #   M2 ~ X + M1  (+ covs)
-            #   M3 ~ X + M1 + M2  (+ covs)
-            #   ...
-            #   Y  ~ X + M1 + M2 + ... + Mk  (+ covs)
-
-            a_coefs:  dict[str, float] = {}   # a_i
-            b_coefs:  dict[str, float] = {}   # b_i
-            d_coefs:  dict[tuple, float] = {} # d_(i,j) for all i<j pairs from mediator regressions
-
-            ok = True
-            for mi_idx, mi in enumerate(mediators):
-                prior_meds = mediators[:mi_idx]  # mediators before current
-                rhs = [pred] + prior_meds + covs
-                try:
-                    Xm = sm.add_constant(d[rhs].values, has_constant="add")
-                    fm = sm.OLS(d[mi].values, Xm).fit()
-                    a_coefs[mi] = float(fm.params[1])  # X coefficient
-                    # d_(prior -> mi) coefficients
-                    for pm_idx, pm in enumerate(prior_meds):
-                        d_coefs[(pm, mi)] = float(fm.params[pm_idx + 2])  # +2: skip const+X
-                except Exception:
-                    ok = False
-                    break
-
-            if not ok:
-                continue
-
-            # Y model: outcome ~ X + M1 + ... + Mk + covs
-            y_rhs = [pred] + mediators + covs
-            try:
-                Xy = sm.add_constant(d[y_rhs].values, has_constant="add")
-                fy = sm.OLS(d[outcome].values, Xy).fit()
-                for mi in mediators:
-                    b_idx_val = y_rhs.index(mi) + 1
-                    b_coefs[mi] = float(fy.params[b_idx_val])
-            except Exception:
-                continue
-
-            # -----------------------------------------------------------------
-            # Compute indirect effects for each path
-            # -----------------------------------------------------------------
-            total_boot = 0.0
-
-            for chain in paths:
-                key = "_".join(chain)
-                try:
-                    effect = a_coefs[chain[0]]
-                    for seg_idx in range(len(chain) - 1):
-                        effect *= d_coefs[(chain[seg_idx], chain[seg_idx + 1])]
-                    effect *= b_coefs[chain[-1]]
-                    boot_storage[key].append(effect)
-                    total_boot += effect
-                except Exception:
-                    boot_storage[key].append(np.nan)
-
-            boot_storage["__total__"].append(total_boot)
-
-        except Exception:
-            # Entire resample failed — skip
-            continue
-
-    # Convert to arrays
-    return {k: np.array(v, dtype=float) for k, v in boot_storage.items()}
-
-
-def _ci_from_boots(
-    boots: np.ndarray,
+    starts, lengths = _indirect_paths_int(k)
+    ends = starts + lengths - 1
+
+    # Serial mediation regressions, as column subsets of one matrix
+    # Z = [const, X, M1..Mk, covs, Y]:
+    #   Mi ~ X + M1 + ... + M(i-1)  (+ covs)  -> a_i, d_(j,i) for j < i
+    #   Y  ~ X + M1 + ... + Mk      (+ covs)  -> b_i
+    Z = data_np[:, [0] + [col_ix[c] for c in [pred] + mediators + covs + [outcome]]]
+    # Centre every non-constant column on its full-sample mean, as the
+    # path_analysis bootstrap does. Slopes are unaffected, but without it
+    # variables with a large mean relative to their spread make Z'WZ nearly
+    # collinear with the constant and the rank test misfires.
+    Z[:, 1:] -= Z[:, 1:].mean(axis=0)
+    q = Z.shape[1]
+    y_col = q - 1
+    cov_cols = list(range(2 + k, y_col))
+    med_cols = [[0, 1, *range(2, 2 + i), *cov_cols] for i in range(k)]
+    y_cols = list(range(y_col))
+
+    # A resample only changes how many times each row is counted. With row
+    # counts W (n_rep, n), every replicate's Z'WZ comes out of one GEMM
+    # against the per-row outer products, without materialising any
+    # resampled rows.
+    ZZ = (Z[:, :, None] * Z[:, None, :]).reshape(n, q * q)
+
+    # One row per replicate: every chain's effect, their total, then the
+    # direct effect c'. A block that fails leaves its rows unmarked in
+    # `success` and they are dropped.
+    n_chains = len(paths)
+    boot_dtype = np.float32 if n_boot >= _BOOT_F32_MIN else np.float64
+    boot_arr = np.empty((n_boot, n_chains + 2), dtype=boot_dtype)
+    success = np.zeros(n_boot, dtype=bool)
+
+    def _moment_effects(G: np.ndarray) -> np.ndarray:
+        """Every chain's effect, their total and c', from stacked Z'Z."""
+        n_rep = len(G)
+        a_coefs = np.empty((n_rep, k))             # a_i
+        d_next  = np.empty((n_rep, k - 1))         # d_(i-1,i); chains only use these
+        for i in range(k):
+            params = _solve_moments(G, med_cols[i], 2 + i)
+            a_coefs[:, i] = params[:, 1]
+            if i > 0:
+                d_next[:, i - 1] = params[:, 1 + i]  # M(i-1) sits after const, X, M1..M(i-2)
+        y_params = _solve_moments(G, y_cols, y_col)
+
+        chain_eff = _chain_effects(a_coefs, d_next, y_params[:, 2:2 + k])
+        effects = np.empty((n_rep, n_chains + 2))
+        effects[:, :n_chains] = chain_eff[:, starts, ends]
+        effects[:, n_chains] = effects[:, :n_chains].sum(axis=1)
+        effects[:, n_chains + 1] = y_params[:, 1]  # X coefficient in the Y model
+        return effects
+
+    def _block_effects(start: int, idx: np.ndarray) -> None:
+        """Write the effects of one block of draws into boot_arr."""
+        n_rep = len(idx)
+        idx += row_offsets[:n_rep]  # in place: the draws are not needed again
+        W = np.bincount(idx.ravel(), minlength=n_rep * n).reshape(n_rep, n)
+        G = (W.astype(np.float64) @ ZZ).reshape(n_rep, q, q)
+        boot_arr[start:start + n_rep] = _moment_effects(G)
+        success[start:start + n_rep] = True
+
+    # Blocks are independent and spend their time in GIL-releasing BLAS and
+    # LAPACK calls, so a thread pool overlaps them without pickling anything
+    # (functions of an exec'd script cannot be sent to a process pool).
+    # Counts are tallied from index draws made here, in order, as in a
+    # row-gathering bootstrap, so the resamples do not depend on scheduling.
+    # At most two blocks per worker are in flight to bound memory.
+    # Draws stay int64 (intp): np.bincount would otherwise cast an int32
+    # index matrix back, costing more than the smaller draw saves.
+    block = int(np.clip(_WEIGHT_MAX_ELEMS // n, 1, _BOOT_BLOCK))
+    row_offsets = np.arange(block)[:, None] * n
+    n_blocks = -(-n_boot // block)
+    n_workers = min(8, os.cpu_count() or 1, n_blocks)
+    futures = []
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        for start in range(0, n_boot, block):
+            idx = rng.integers(0, n, size=(min(block, n_boot - start), n))
+            futures.append(pool.submit(_block_effects, start, idx))
+            if len(futures) > 2 * n_workers:
+                futures[-2 * n_workers - 1].exception()
+        for f in futures:
+            f.exception()
+
+    boot_arr = boot_arr[success]
+    keys = ["_".join(chain) for chain in paths] + ["__total__", "__c_prime__"]
+    boots = {key: boot_arr[:, j] for j, key in enumerate(keys)}
+    if not jackknife:
+        return boots, None
+
+    # Leaving row i out downdates Z'Z by that row's outer product, so the n
+    # jackknife fits reuse the bootstrap's moment solver block by block.
+    G_full = ZZ.sum(axis=0)
+    theta = _moment_effects(G_full.reshape(1, q, q))[0]
+    jack_arr = np.empty((n, len(keys)))
+    for start in range(0, n, block):
+        G = (G_full - ZZ[start:start + block]).reshape(-1, q, q)
+        jack_arr[start:start + len(G)] = _moment_effects(G)
+    jack = {key: (float(theta[j]), jack_arr[:, j]) for j, key in enumerate(keys)}
+    return boots, jack
+
+
+
+def _bca_quantiles(
+    boots_mat: np.ndarray,
+    theta: np.ndarray,
+    jack_mat: np.ndarray,
     alpha_tail: float,
-) -> tuple[float | None, float | None, float | None]:
-    """Return (boot_se, ci_lower, ci_upper) from a bootstrap array."""
-    valid = boots[np.isfinite(boots)]
-    if len(valid) < 10:
-        return None, None, None
-    boot_se  = round(float(np.std(valid, ddof=1)), 6)
-    ci_lower = round(float(np.percentile(valid, alpha_tail * 100)),       6)
-    ci_upper = round(float(np.percentile(valid, (1 - alpha_tail) * 100)), 6)
-    return boot_se, ci_lower, ci_upper
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    BCa interval endpoints for each row of a (n_effects, n_boot) matrix
+    (NaN marks dropped draws), given full-sample estimates theta and
+    (n_effects, n) leave-one-out estimates.
+
+    z0 is the bias correction from the share of draws below theta and a the
+    jackknife acceleration; the adjusted percentiles differ by row, so they
+    are read off the sorted draws with numpy's linear interpolation. Rows
+    where the BCa level is undefined get the percentile interval instead.
+    """
+    n_valid = np.sum(~np.isnan(boots_mat), axis=1)
+    below = np.sum(boots_mat < theta[:, None], axis=1) / n_valid
+    z0 = scipy_stats.norm.ppf(below)
+
+    dev = jack_mat.mean(axis=1, keepdims=True) - jack_mat
+    num = np.sum(dev ** 3, axis=1)
+    den = 6.0 * np.sum(dev ** 2, axis=1) ** 1.5
+    acc = np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+    sorted_mat = np.sort(boots_mat, axis=1)     # NaN sorts last
+    rows = np.arange(len(boots_mat))
+    ends = []
+    for level in (alpha_tail, 1 - alpha_tail):
+        z_alpha = scipy_stats.norm.ppf(level)
+        with np.errstate(invalid="ignore"):
+            q = scipy_stats.norm.cdf(z0 + (z0 + z_alpha) / (1 - acc * (z0 + z_alpha)))
+        # Undefined when every draw falls on one side of theta (z0 = +/-inf)
+        # with a nonzero acceleration: use the plain percentile endpoint
+        q = np.where(np.isnan(q), level, q)
+        pos = q * (n_valid - 1)
+        lo_i = np.floor(pos).astype(np.intp)
+        hi_i = np.minimum(lo_i + 1, n_valid - 1)
+        frac = pos - lo_i
+        lo_v = sorted_mat[rows, lo_i]
+        ends.append(lo_v + (sorted_mat[rows, hi_i] - lo_v) * frac)
+    return ends[0], ends[1]
+
+
+def _cis_from_boots(
+    boots_mat: np.ndarray,
+    alpha_tail: float,
+    theta: np.ndarray | None = None,
+    jack_mat: np.ndarray | None = None,
+) -> list[tuple[float | None, float | None, float | None]]:
+    """
+    Return (boot_se, ci_lower, ci_upper) for each row of a stacked
+    (n_effects, n_boot) bootstrap matrix. Non-finite draws are ignored;
+    rows with fewer than 10 valid draws get (None, None, None).
+    Intervals are percentile ones unless theta and jack_mat are given,
+    in which case they are BCa.
+    """
+    boots_mat = np.where(np.isfinite(boots_mat), boots_mat, np.nan)
+    ok = np.sum(~np.isnan(boots_mat), axis=1) >= 10
+    out: list[tuple] = [(None, None, None)] * len(boots_mat)
+    if ok.any():
+        if theta is None:
+            # One batched call sorts every row's draws
+            lo, hi = np.nanpercentile(
+                boots_mat[ok], [alpha_tail * 100, (1 - alpha_tail) * 100], axis=1
+            )
+        else:
+            lo, hi = _bca_quantiles(boots_mat[ok], theta[ok], jack_mat[ok], alpha_tail)
+        se = np.nanstd(boots_mat[ok], axis=1, ddof=1)
+        for j, row in enumerate(np.flatnonzero(ok)):
+            out[row] = (round(float(se[j]), 6), round(float(lo[j]), 6), round(float(hi[j]), 6))
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -312,6 +537,7 @@ _ci_level     = 0.95
 _do_std       = False
 _do_effect_sz = True   # reserved
 _do_total     = True
+_ci_method    = "percentile"
 
 if "bootstrap" in dir() and bootstrap is not None:      # noqa: F821
     _do_bootstrap = bool(bootstrap)                     # noqa: F821
@@ -326,6 +552,10 @@ if "effectSize" in dir() and effectSize is not None:    # noqa: F821
     _do_effect_sz = bool(effectSize)                    # noqa: F821
 if "totalEffect" in dir() and totalEffect is not None:  # noqa: F821
     _do_total = bool(totalEffect)                       # noqa: F821
+if "ciMethod" in dir() and ciMethod is not None:        # noqa: F821
+    _ci_method = str(ciMethod).lower()                  # noqa: F821
+    if _ci_method not in ("percentile", "bca"):
+        raise ValueError("ciMethod must be 'percentile' or 'bca'")
 
 # Validate columns
 _all_col_names = [_pred_name] + _med_names + [_outcome_name] + _cov_names
@@ -341,12 +571,21 @@ if _pred_name == _outcome_name:
     raise ValueError("independentVar and dependentVar must differ")
 
 # ---------------------------------------------------------------------------
-# Build DataFrame
+# Build data matrix
 # ---------------------------------------------------------------------------
 
-df = pd.DataFrame({col: _coerce(_data[col]) for col in _all_col_names})
-df = df.dropna()
-n  = len(df)
+# Columns are written straight into one preallocated float64 matrix, in the
+# [X, M1..Mk, covs, Y] order the models use, then incomplete rows are dropped.
+_master_cols = [_pred_name] + _med_names + _cov_names + [_outcome_name]
+_n_raw = len(_data[_pred_name])
+_data_np = np.empty((_n_raw, len(_master_cols)), dtype=np.float64)
+for _j, _col in enumerate(_master_cols):
+    _vals = np.asarray(_data[_col], dtype=np.float64)
+    if len(_vals) != _n_raw:
+        raise ValueError("All data columns must have the same length")
+    _data_np[:, _j] = _vals
+_data_np = _data_np[~np.isnan(_data_np).any(axis=1)]
+n  = len(_data_np)
 
 _n_params_min = len(_all_col_names) + 2
 if n < _n_params_min:
@@ -355,16 +594,29 @@ if n < _n_params_min:
         f"{len(_med_names)} mediator(s). Need at least {_n_params_min} complete cases."
     )
 
-# Standardize if requested
+# Standardize if requested (constant columns are left as they are)
 if _do_std:
-    for col in _all_col_names:
-        col_std = df[col].std(ddof=1)
-        if col_std > 0:
-            df[col] = (df[col] - df[col].mean()) / col_std
+    _mu = _data_np.mean(axis=0)
+    _sd = _data_np.std(axis=0, ddof=1)
+    _const = ~(_sd > 0)
+    _mu[_const] = 0.0
+    _sd[_const] = 1.0
+    _data_np = (_data_np - _mu) / _sd
 
 _alpha_tail = (1 - _ci_level) / 2
 _k = len(_med_names)
 
+# One master matrix [const, X, M1..Mk, covs, Y] with the constant prepended
+# once. Every model below (and the bootstrap) works on column slices of it;
+# each slice is factorized on its own with a thin QR.
+_X_master = np.empty((n, len(_master_cols) + 1), dtype=np.float64)
+_X_master[:, 0]  = 1.0
+_X_master[:, 1:] = _data_np
+_col_ix   = {_c: _i + 1 for _i, _c in enumerate(_master_cols)}
+_X_full   = _X_master[:, :-1]     # [const, X, M1..Mk, covs]
+_cov_cols = list(range(2 + _k, _X_full.shape[1]))
+_y_vec    = _X_master[:, -1]
+
 # ---------------------------------------------------------------------------
 # Fit regression models
 # ---------------------------------------------------------------------------
@@ -382,14 +634,17 @@ _r2_meds: list[dict] = []
 
 for _mi_idx, _mi in enumerate(_med_names):
     _prior = _med_names[:_mi_idx]
-    _rhs   = [_pred_name] + _prior + _cov_names
-    _Xm    = sm.add_constant(df[_rhs].values, has_constant="add")
-    _fm    = sm.OLS(df[_mi].values, _Xm).fit()
+    # const, X, prior mediators, covariates
+    _fm    = _fit_ols(
+        _X_full[:, [0, 1, *range(2, 2 + _mi_idx), *_cov_cols]],
+        _X_master[:, _col_ix[_mi]],
+    )
+    _fm_tab = _coef_table(_fm)
 
     # a_i: X -> Mi (param index 1)
     _a_paths.append({
         "mediator": _mi,
-        **_extract_coef_by_idx(_fm, 1),
+        **_pack(_fm_tab, 1),
     })
 
     # d_(pm, mi): prior mediator -> current mediator
@@ -397,46 +652,34 @@ for _mi_idx, _mi in enumerate(_med_names):
         _d_paths.append({
             "from": _pm,
             "to":   _mi,
-            **_extract_coef_by_idx(_fm, _pm_offset + 2),  # +2: skip const + X
+            **_pack(_fm_tab, _pm_offset + 2),  # +2: skip const + X
         })
 
     _r2_meds.append({
         "mediator":    _mi,
-        "r_squared":     round(float(_fm.rsquared),     6),
-        "adj_r_squared": round(float(_fm.rsquared_adj), 6),
+        "r_squared":     float(_fm.rsquared),
+        "adj_r_squared": float(_fm.rsquared_adj),
     })
 
 # --- Outcome regression (direct model): Y ~ X + M1 + ... + Mk + covs ---
 _y_rhs    = [_pred_name] + _med_names + _cov_names
-_Xy       = sm.add_constant(df[_y_rhs].values, has_constant="add")
-_fit_y    = sm.OLS(df[_outcome_name].values, _Xy).fit()
+_fit_y    = _fit_ols(_X_full, _y_vec)
+_y_tab    = _coef_table(_fit_y)
 
 _b_paths: list[dict] = []
 for _mi in _med_names:
     _b_paths.append({
         "mediator": _mi,
-        **_extract_coef_by_name(_fit_y, _mi, _y_rhs),
+        **_pack_by_name(_y_tab, _mi, _y_rhs),
     })
 
-_path_c_prime = {
-    "coef": round(float(_fit_y.params[1]), 6),
-    "se":   round(float(_fit_y.bse[1]),    6),
-    "t":    round(float(_fit_y.tvalues[1]),6),
-    "p":    round(float(_fit_y.pvalues[1]),8),
-}
+_path_c_prime = _pack(_y_tab, 1)
 _r2_y     = float(_fit_y.rsquared)
 _adj_r2_y = float(_fit_y.rsquared_adj)
 
 # --- Total effect: Y ~ X + covs ---
-_total_rhs = [_pred_name] + _cov_names
-_Xt        = sm.add_constant(df[_total_rhs].values, has_constant="add")
-_fit_total = sm.OLS(df[_outcome_name].values, _Xt).fit()
-_path_c    = {
-    "coef": round(float(_fit_total.params[1]), 6),
-    "se":   round(float(_fit_total.bse[1]),    6),
-    "t":    round(float(_fit_total.tvalues[1]),6),
-    "p":    round(float(_fit_total.pvalues[1]),8),
-}
+_fit_total = _fit_ols(_X_full[:, [0, 1, *_cov_cols]], _y_vec)
+_path_c    = _pack(_coef_table(_fit_total), 1)
 
 # ---------------------------------------------------------------------------
 # Point estimates for all indirect paths
@@ -447,15 +690,17 @@ _b_lookup: dict[str, float] = {p["mediator"]: p["coef"] for p in _b_paths}
 _d_lookup: dict[tuple, float] = {(p["from"], p["to"]): p["coef"] for p in _d_paths}
 
 _all_chains  = _indirect_paths(_med_names)
-_point_ests: dict[str, float] = {}
+_starts, _lengths = _indirect_paths_int(_k)
 
-for _chain in _all_chains:
-    _key = "_".join(_chain)
-    _eff = _a_lookup[_chain[0]]
-    for _seg in range(len(_chain) - 1):
-        _eff *= _d_lookup.get((_chain[_seg], _chain[_seg + 1]), 0.0)
-    _eff *= _b_lookup[_chain[-1]]
-    _point_ests[_key] = _eff
+_chain_mat = _chain_effects(
+    np.array([_a_lookup[_m] for _m in _med_names]),
+    np.array([_d_lookup.get((_med_names[_i], _med_names[_i + 1]), 0.0) for _i in range(_k - 1)]),
+    np.array([_b_lookup[_m] for _m in _med_names]),
+)
+_point_ests: dict[str, float] = dict(zip(
+    ("_".join(_chain) for _chain in _all_chains),
+    _chain_mat[_starts, _starts + _lengths - 1].tolist(),
+))
 
 _total_indirect_est = sum(_point_ests.values())
 
@@ -468,24 +713,29 @@ _boot_results: dict[str, tuple] = {}  # key -> (boot_se, ci_lower, ci_upper)
 if _do_bootstrap:
     _rng = np.random.default_rng(20240601)
     try:
-        _all_boots = _run_bootstrap(
-            df, _pred_name, _med_names, _outcome_name,
-            _cov_names, _n_boot, _rng,
+        # The master matrix is shared by the point fits and the bootstrap
+        _all_boots, _jack = _run_bootstrap(
+            _X_master, _col_ix, _pred_name, _med_names, _outcome_name,
+            _cov_names, _n_boot, _rng, jackknife=(_ci_method == "bca"),
+        )
+        # Every chain, the total indirect effect and c', stacked row-wise
+        _boot_keys = (
+            ["_".join(_chain) for _chain in _all_chains] + ["__total__", "__c_prime__"]
         )
-        for _chain in _all_chains:
-            _key = "_".join(_chain)
-            _se, _lo, _hi = _ci_from_boots(_all_boots.get(_key, np.array([])), _alpha_tail)
-            _boot_results[_key] = (_se, _lo, _hi)
-
-        # Total indirect
-        _t_se, _t_lo, _t_hi = _ci_from_boots(
-            _all_boots.get("__total__", np.array([])), _alpha_tail
+        _theta = _jack_mat = None
+        if _jack is not None:
+            _theta    = np.array([_jack[_key][0] for _key in _boot_keys])
+            _jack_mat = np.vstack([_jack[_key][1] for _key in _boot_keys])
+        *_chain_cis, (_t_se, _t_lo, _t_hi), (_, _d_lo, _d_hi) = _cis_from_boots(
+            np.vstack([_all_boots[_key] for _key in _boot_keys]), _alpha_tail,
+            _theta, _jack_mat,
         )
+        _boot_results.update(zip(_boot_keys, _chain_cis))
     except Exception as _boot_exc:
         warnings.warn(f"Bootstrap failed: {_boot_exc}")
-        _t_se = _t_lo = _t_hi = None
+        _t_se = _t_lo = _t_hi = _d_lo = _d_hi = None
 else:
-    _t_se = _t_lo = _t_hi = None
+    _t_se = _t_lo = _t_hi = _d_lo = _d_hi = None
 
 # ---------------------------------------------------------------------------
 # Build indirect output list
@@ -524,7 +774,7 @@ _total_sig = _make_significant(_t_lo, _t_hi)
 
 _ci_pct = _ci_level * 100
 _method = (
-    f"bias-corrected bootstrap (B = {_n_boot})" if _do_bootstrap
+    f"{'BCa' if _ci_method == 'bca' else 'percentile'} bootstrap (B = {_n_boot})" if _do_bootstrap
     else "product-of-coefficients (no bootstrap)"
 )
 _med_chain_str = " -> ".join(_med_names)
@@ -577,11 +827,11 @@ result = {
     "outcome":    _outcome_name,
     "covariates": _cov_names if _cov_names else None,
     "paths": {
-        "a":       _a_paths,
-        "b":       _b_paths,
-        "d":       _d_paths,
-        "c":       _path_c,
-        "c_prime": _path_c_prime,
+        "a":       [_rounded(_p) for _p in _a_paths],
+        "b":       [_rounded(_p) for _p in _b_paths],
+        "d":       [_rounded(_p) for _p in _d_paths],
+        "c":       _rounded(_path_c),
+        "c_prime": _rounded(_path_c_prime),
     },
     "indirect": _indirect_list,
     "total_indirect": {
@@ -592,24 +842,31 @@ result = {
         "significant": _total_sig,
     },
     "direct": {
-        "effect": _path_c_prime["coef"],
-        "se":     _path_c_prime["se"],
-        "t":      _path_c_prime["t"],
-        "p":      _path_c_prime["p"],
+        "effect": round(_path_c_prime["coef"], 6),
+        "se":     round(_path_c_prime["se"],   6),
+        "t":      round(_path_c_prime["t"],    6),
+        "p":      round(_path_c_prime["p"],    8),
+        "boot_ci_lower": _d_lo,
+        "boot_ci_upper": _d_hi,
     },
     "total": {
-        "effect": _path_c["coef"],
-        "se":     _path_c["se"],
-        "t":      _path_c["t"],
-        "p":      _path_c["p"],
+        "effect": round(_path_c["coef"], 6),
+        "se":     round(_path_c["se"],   6),
+        "t":      round(_path_c["t"],    6),
+        "p":      round(_path_c["p"],    8),
     } if _do_total else None,
     "model_summary": {
         "r_squared_y":            round(_r2_y,     6),
         "adj_r_squared_y":        round(_adj_r2_y, 6),
-        "r_squared_mediators":    _r2_meds,
+        "r_squared_mediators":    [
+            {**_r, "r_squared":     round(_r["r_squared"],     6),
+                   "adj_r_squared": round(_r["adj_r_squared"], 6)}
+            for _r in _r2_meds
+        ],
     },
     "standardized":   _do_std,
     "ci_level":       _ci_level,
     "n_boot":         _n_boot if _do_bootstrap else None,
+    "ci_method":      _ci_method if _do_bootstrap else None,
     "interpretation": interpretation,
 }
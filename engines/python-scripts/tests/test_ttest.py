@@ -0,0 +1,57 @@
+"""
+Regression tests for ttest.py, run by exec'ing the script the way
+wrapper.py does.
+"""
+
+import contextlib
+import io
+import os
+import warnings
+
+import pytest
+
+_SCRIPT = os.path.join(os.path.dirname(__file__), "..", "ttest.py")
+
+_DATA = {
+    "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    "s": ["x", "y", "x", "y", "x", "y"],
+    "empty": [None] * 6,
+    "g": [1, 2, 1, 2, 1, 2],
+}
+
+
+def _run(**params) -> dict:
+    with open(_SCRIPT, encoding="utf-8") as f:
+        code = compile(f.read(), _SCRIPT, "exec")
+    namespace = {"__builtins__": __builtins__, "data": _DATA, **params}
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(code, namespace)
+    return namespace["result"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"test_type": "one-sample"},
+        {"test_type": "independent", "groupingVariable": ["g"]},
+    ],
+)
+def test_bad_extra_test_variables_are_reported_per_variable(params):
+    # Extra variables that are non-numeric, missing or empty get an error
+    # entry; the first variable's result is the one a lone request gives
+    alone = _run(testVariables=["a"], **params)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        mixed = _run(testVariables=["a", "s", "zz", "empty"], **params)
+
+    for key in ("statistic", "df", "p_value", "confidence_interval", "descriptives"):
+        assert mixed[key] == alone[key]
+    assert mixed["per_variable"][0] == alone["per_variable"][0]
+    assert [entry["variable"] for entry in mixed["per_variable"]] == ["a", "s", "zz", "empty"]
+    for entry in mixed["per_variable"][1:]:
+        assert set(entry) == {"variable", "error"}
+
+
+def test_bad_first_test_variable_still_fails():
+    with pytest.raises(ValueError, match="not found"):
+        _run(test_type="one-sample", testVariables=["zz", "a"])
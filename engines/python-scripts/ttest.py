@@ -12,11 +12,12 @@ Expected namespace variables (injected by engine):
       Columnar data dictionary with column names as keys and arrays as values.
 
   -- For "one-sample" --
-  testVariables : list[str]   Column names of variables to test.
+  testVariables : list[str]   Column names of variables to test (all are
+                              tested; the top-level fields describe the first).
   options.testValue : float   Hypothesised population mean (default 0).
 
   -- For "independent" --
-  testVariables    : list[str]   Column names of test variables.
+  testVariables    : list[str]   Column names of test variables (as above).
   groupingVariable : list[str]   Column name of grouping variable (length 1).
   options.group1Value, options.group2Value : values defining the two groups.
 
@@ -46,14 +47,23 @@ Result structure
     "group1": {"n": int, "mean": float, "std": float, "se": float},
     ...
   },
-  "interpretation": str
+  "interpretation": str,
+  "per_variable": [                      (one-sample / independent only)
+    {"variable": str, "statistic": ..., "df": ..., "p_value": ...,
+     "significant": ..., "effect_size": ..., "confidence_interval": ...,
+     "descriptives": ...},
+    {"variable": str, "error": str},     (an extra variable that could not
+    ...                                   be tested: missing, non-numeric or
+  ]                                       fewer than 2 values)
 }
 """
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
-from scipy import stats as scipy_stats
+from scipy.special import stdtr, stdtrit
 from typing import Optional
 
 
@@ -61,32 +71,75 @@ from typing import Optional
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _coerce(x) -> np.ndarray:
-    """Convert list-like to a clean float64 array, dropping NaN."""
-    arr = np.array(x, dtype=float)
-    return arr[~np.isnan(arr)]
-
-
-def _desc(arr: np.ndarray) -> dict:
-    n = len(arr)
-    mean = float(np.mean(arr))
-    std = float(np.std(arr, ddof=1)) if n > 1 else 0.0
-    se = std / np.sqrt(n) if n > 0 else 0.0
-    return {"n": n, "mean": round(mean, 6), "std": round(std, 6), "se": round(se, 6)}
+def _stats(arr: np.ndarray) -> tuple[int, float, float, float, float]:
+    """
+    Return (n, mean, var, std, se) of a clean array, with var/std using
+    ddof=1 (var/std/se are 0.0 when n < 2). The sum and the squared
+    deviations are each taken once and every descriptive, t statistic, CI,
+    df and effect size below is derived from these scalars. The deviations
+    are one temporary array; their sum of squares is then a single dot
+    product rather than a squared copy followed by a sum.
+    """
+    n = arr.size
+    mean = float(arr.sum()) / n if n > 0 else float("nan")
+    if n < 2:
+        return n, mean, 0.0, 0.0, 0.0
+    dev = arr - mean
+    var = float(dev @ dev) / (n - 1)
+    std = math.sqrt(var)
+    return n, mean, var, std, std / math.sqrt(n)
+
+
+def _col_stats(X: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Column-wise _stats of a (rows, k) array, ignoring NaN per column, so k
+    test variables are reduced in one pass each for the sum and the squared
+    deviations. Columns with fewer than 2 values come back as NaN/inf
+    entries, which the caller reports per variable.
+    """
+    valid = ~np.isnan(X)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dev = np.where(valid, X, 0.0)
+        mean = dev.sum(axis=0) / n
+        dev -= mean
+        dev[~valid] = 0.0
+        var = np.einsum("ij,ij->j", dev, dev) / (n - 1)
+        std = np.sqrt(var)
+        return n, mean, var, std, std / np.sqrt(n)
+
+
+def _desc(n: int, mean: float, std: float, se: float) -> dict:
+    return {
+        "n": int(n),
+        "mean": float(mean),
+        "std": float(std),
+        "se": float(se),
+    }
 
 
-def _cohens_d(arr1: np.ndarray, arr2: Optional[np.ndarray] = None, mu: float = 0.0) -> dict:
-    """Compute Cohen's d and interpret its magnitude."""
-    if arr2 is None:
-        # One-sample or paired: d = (mean - mu) / std
-        d = float((np.mean(arr1) - mu) / np.std(arr1, ddof=1)) if len(arr1) > 1 else 0.0
-    else:
-        # Independent samples: pooled-std version
-        n1, n2 = len(arr1), len(arr2)
-        std1, std2 = float(np.std(arr1, ddof=1)), float(np.std(arr2, ddof=1))
-        pooled_std = np.sqrt(((n1 - 1) * std1 ** 2 + (n2 - 1) * std2 ** 2) / (n1 + n2 - 2))
-        d = float((np.mean(arr1) - np.mean(arr2)) / pooled_std) if pooled_std > 0 else 0.0
-
+def _cohens_d(stats1: tuple, stats2: Optional[tuple] = None, mu: float = 0.0):
+    """
+    Cohen's d from _stats / _col_stats tuples (scalars or per-variable
+    arrays): (mean - mu) / std for one sample, pooled std for two.
+    """
+    _, mean1, var1, std1, _ = stats1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if stats2 is None:
+            return np.divide(mean1 - mu, std1)
+        n1 = stats1[0]
+        n2, mean2, var2, _, _ = stats2
+        pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+        # Two constant groups have no pooled spread; report d = 0 as before
+        return np.divide(
+            mean1 - mean2, pooled_std,
+            out=np.zeros(np.shape(pooled_std)), where=pooled_std > 0,
+        )
+
+
+def _effect(d: float) -> dict:
+    """Interpret the magnitude of Cohen's d."""
+    d = float(d)
     abs_d = abs(d)
     if abs_d < 0.2:
         interpretation = "negligible"
@@ -97,23 +150,111 @@ def _cohens_d(arr1: np.ndarray, arr2: Optional[np.ndarray] = None, mu: float = 0
     else:
         interpretation = "large"
 
-    return {"cohens_d": round(d, 6), "interpretation": interpretation}
+    return {"cohens_d": d, "interpretation": interpretation}
+
+
+def _t_test(diff, se, df, alternative: str):
+    """
+    Return (t, p) for estimates `diff` with standard errors `se`, i.e. what
+    scipy's ttest_* functions give, from moments already computed here.
+    Works elementwise on per-variable arrays as well as on scalars.
+    """
+    # Zero variance: as scipy, nan for 0/0 and a signed inf otherwise
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.divide(diff, se)
+    if alternative == "less":
+        p = stdtr(df, t)
+    elif alternative == "greater":
+        p = stdtr(df, -t)
+    elif alternative == "two-sided":
+        p = 2 * stdtr(df, -np.abs(t))
+    else:
+        raise ValueError("alternative must be 'less', 'greater', or 'two-sided'")
+    return t, p
+
 
+def _ci(mean_diff, se, df, alpha: float):
+    """Return the (lower, upper) confidence bounds for `mean_diff`."""
+    # stdtrit is the C routine behind t.ppf, without the rv_continuous dispatch
+    half = stdtrit(df, 1 - alpha / 2) * se
+    return mean_diff - half, mean_diff + half
 
-def _ci(mean_diff: float, se: float, df: float, alpha: float) -> dict:
-    t_crit = float(scipy_stats.t.ppf(1 - alpha / 2, df))
+
+def _ci_dict(lower: float, upper: float, alpha: float) -> dict:
     return {
-        "lower": round(mean_diff - t_crit * se, 6),
-        "upper": round(mean_diff + t_crit * se, 6),
+        "lower": float(lower),
+        "upper": float(upper),
         "level": 1 - alpha,
     }
 
 
-def _get_column(col_name: str, data_dict: dict) -> np.ndarray:
-    """Get column data by name from the data dictionary."""
-    if col_name not in data_dict:
-        raise ValueError(f"Column '{col_name}' not found in data")
-    return _coerce(data_dict[col_name])
+def _group_mask(group_data: np.ndarray, value) -> np.ndarray:
+    """
+    Boolean mask of rows whose group equals `value`. The value is brought to
+    the column's kind once (float for numeric columns, str for string ones),
+    so the mask is a single typed comparison.
+    """
+    if group_data.dtype.kind in "biuf":
+        try:
+            return group_data == float(value)
+        except (TypeError, ValueError):
+            return np.zeros(group_data.shape, dtype=bool)
+    if group_data.dtype.kind in "US":
+        return group_data == str(value)
+    # Object columns (e.g. numbers mixed with None): match either form
+    return (group_data == value) | (group_data == str(value))
+
+
+def _get_columns(col_names: list, data_dict: dict) -> tuple[np.ndarray, dict]:
+    """
+    Stack the usable named columns into a (rows, k) float64 array, NaN kept.
+
+    Returns the array and a dict mapping every other column that is missing
+    or not numeric to its error message. A problem with the first column
+    raises instead, since the top-level result describes it.
+    """
+    cols, errors = [], {}
+    for i, col_name in enumerate(col_names):
+        try:
+            if col_name not in data_dict:
+                raise ValueError(f"Column '{col_name}' not found in data")
+            cols.append(np.asarray(data_dict[col_name], dtype=np.float64))
+        except (TypeError, ValueError) as exc:
+            if i == 0:
+                raise
+            errors[col_name] = str(exc)
+    return np.column_stack(cols), errors
+
+
+def _per_variable_list(col_names: list, results: dict, errors: dict) -> list[dict]:
+    """Per-variable entries in request order; failed ones only carry an error."""
+    return [
+        results[c] if c in results else {"variable": c, "error": errors[c]}
+        for c in col_names
+    ]
+
+
+def _variable_result(
+    name: str,
+    stat: float,
+    df: float,
+    p: float,
+    d: float,
+    ci: tuple[float, float],
+    descriptives: dict,
+) -> dict:
+    """Result fields of one test variable (the top level repeats the first)."""
+    p = float(p)
+    return {
+        "variable": name,
+        "statistic": float(stat),
+        "df": float(df),
+        "p_value": p,
+        "significant": p < _alpha,
+        "effect_size": _effect(d),
+        "confidence_interval": _ci_dict(ci[0], ci[1], _alpha),
+        "descriptives": descriptives,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -133,29 +274,45 @@ _data = data if "data" in dir() else {}  # noqa: F821
 # ---------------------------------------------------------------------------
 
 if _test_type == "one-sample":
-    # Get test variable name and data
+    # Get test variable names and data
     if "testVariables" not in dir() or len(testVariables) == 0:  # noqa: F821
         raise ValueError("testVariables is required for one-sample t-test")
 
-    var_name = testVariables[0]  # noqa: F821
-    _x = _get_column(var_name, _data)
+    _var_names = list(testVariables)  # noqa: F821
+    var_name = _var_names[0]
+    _X, _errors = _get_columns(_var_names, _data)
+    _names = [v for v in _var_names if v not in _errors]
 
     _mu = float(_options.get("testValue", 0)) if _options else 0.0
 
-    if len(_x) < 2:
+    # All variables are tested at once: each reduction below runs over the
+    # (rows, k) block and the per-variable dicts are only built at the end
+    _sx = _col_stats(_X)
+    _ns, _means, _, _sds, _ses = _sx
+    if _ns[0] < 2:
         raise ValueError("Test variable must have at least 2 non-missing values")
-
-    _stat, _p = scipy_stats.ttest_1samp(_x, popmean=_mu, alternative=_alternative)
-    _df_val = float(len(_x) - 1)
-    _se = float(np.std(_x, ddof=1) / np.sqrt(len(_x)))
-    _ci_dict = _ci(float(np.mean(_x)) - _mu, _se, _df_val, _alpha)
-    _effect = _cohens_d(_x, mu=_mu)
-    _descriptives = {"sample": _desc(_x)}
-
+    _dfs = _ns - 1.0
+    _stats_t, _ps = _t_test(_means - _mu, _ses, _dfs, _alternative)
+    _lowers, _uppers = _ci(_means - _mu, _ses, _dfs, _alpha)
+    _ds = _cohens_d(_sx, mu=_mu)
+    _results = {}
+    for j, _name in enumerate(_names):
+        if _ns[j] < 2:
+            _errors[_name] = "Test variable must have at least 2 non-missing values"
+            continue
+        _results[_name] = _variable_result(
+            _name, _stats_t[j], _dfs[j], _ps[j], _ds[j],
+            (_lowers[j], _uppers[j]),
+            {"sample": _desc(_ns[j], _means[j], _sds[j], _ses[j])},
+        )
+    _per_variable = _per_variable_list(_var_names, _results, _errors)
+
+    _mean, _sd = float(_means[0]), float(_sds[0])
+    _df_val, _stat, _p = float(_dfs[0]), float(_stats_t[0]), float(_ps[0])
     _interp = (
         f"One-sample t-test: t({_df_val:.2f}) = {_stat:.3f}, "
         f"p {'<' if _p < _alpha else '>='} {_alpha:.4f}. "
-        f"The mean of {var_name} (M = {np.mean(_x):.3f}, SD = {np.std(_x, ddof=1):.3f}) is "
+        f"The mean of {var_name} (M = {_mean:.3f}, SD = {_sd:.3f}) is "
         f"{'significantly' if _p < _alpha else 'not significantly'} different from {_mu:.3f}."
     )
 
@@ -166,53 +323,78 @@ elif _test_type == "independent":
     if "groupingVariable" not in dir() or len(groupingVariable) == 0:  # noqa: F821
         raise ValueError("groupingVariable is required for independent t-test")
 
-    var_name = testVariables[0]  # noqa: F821
+    _var_names = list(testVariables)  # noqa: F821
+    var_name = _var_names[0]
     group_name = groupingVariable[0]  # noqa: F821
 
     # Access column data from the data dictionary
-    if var_name not in _data:
-        raise ValueError(f"Column '{var_name}' not found in data")
+    test_data, _errors = _get_columns(_var_names, _data)
+    _names = [v for v in _var_names if v not in _errors]
     if group_name not in _data:
         raise ValueError(f"Grouping column '{group_name}' not found in data")
-
-    test_data = np.array(_data[var_name], dtype=float)
-    group_data = np.array(_data[group_name])
+    group_data = np.asarray(_data[group_name])
 
     # Get group values from options
     g1_val = _options.get("group1Value", 1) if _options else 1
     g2_val = _options.get("group2Value", 2) if _options else 2
 
-    # Split data by group
-    mask1 = (group_data == g1_val) | (group_data == str(g1_val))
-    mask2 = (group_data == g2_val) | (group_data == str(g2_val))
-
-    _x1 = test_data[mask1 & ~np.isnan(test_data)]
-    _x2 = test_data[mask2 & ~np.isnan(test_data)]
-
-    if len(_x1) < 2:
+    # Split data by group; missing values are dropped per variable by
+    # _col_stats, so one row selection serves every test variable
+    mask1 = _group_mask(group_data, g1_val)
+    mask2 = _group_mask(group_data, g2_val)
+    _X1 = test_data[mask1]
+    _X2 = test_data[mask2]
+
+    _sx1, _sx2 = _col_stats(_X1), _col_stats(_X2)
+    n1, m1, s1, sd1, se1 = _sx1
+    n2, m2, s2, sd2, se2 = _sx2
+    if n1[0] < 2:
         raise ValueError("Group 1 must have at least 2 non-missing values")
-    if len(_x2) < 2:
+    if n2[0] < 2:
         raise ValueError("Group 2 must have at least 2 non-missing values")
 
-    _stat, _p = scipy_stats.ttest_ind(_x1, _x2, equal_var=False, alternative=_alternative)
-
-    # Welch–Satterthwaite df
-    s1, s2 = np.var(_x1, ddof=1), np.var(_x2, ddof=1)
-    n1, n2 = len(_x1), len(_x2)
-    _df_val = float((s1 / n1 + s2 / n2) ** 2 / (
-        (s1 / n1) ** 2 / (n1 - 1) + (s2 / n2) ** 2 / (n2 - 1)
-    ))
-
-    _se = float(np.sqrt(np.var(_x1, ddof=1) / len(_x1) + np.var(_x2, ddof=1) / len(_x2)))
-    _ci_dict = _ci(float(np.mean(_x1) - np.mean(_x2)), _se, _df_val, _alpha)
-    _effect = _cohens_d(_x1, _x2)
-    _descriptives = {"group1": _desc(_x1), "group2": _desc(_x2)}
-
+    # Welch–Satterthwaite df (undefined when both groups are constant), from
+    # the per-group squared standard errors _col_stats already produced.
+    # Variables short of 2 values per group give NaN here and are reported
+    # as errors below.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        _v1, _v2 = s1 / n1, s2 / n2
+        _vsum = _v1 + _v2
+        _df_den = _v1 * _v1 / (n1 - 1) + _v2 * _v2 / (n2 - 1)
+        _dfs = np.divide(
+            _vsum * _vsum, _df_den,
+            out=np.full(_df_den.shape, np.nan), where=_df_den > 0,
+        )
+        _ses = np.sqrt(_vsum)
+    # Like scipy's ttest_ind, an undefined df falls back to 1 for the p-value
+    _stats_t, _ps = _t_test(
+        m1 - m2, _ses, np.where(np.isnan(_dfs), 1.0, _dfs), _alternative
+    )
+    _lowers, _uppers = _ci(m1 - m2, _ses, _dfs, _alpha)
+    _ds = _cohens_d(_sx1, _sx2)
+    _results = {}
+    for j, _name in enumerate(_names):
+        if n1[j] < 2 or n2[j] < 2:
+            _errors[_name] = (
+                f"Group {1 if n1[j] < 2 else 2} must have at least 2 non-missing values"
+            )
+            continue
+        _results[_name] = _variable_result(
+            _name, _stats_t[j], _dfs[j], _ps[j], _ds[j],
+            (_lowers[j], _uppers[j]),
+            {
+                "group1": _desc(n1[j], m1[j], sd1[j], se1[j]),
+                "group2": _desc(n2[j], m2[j], sd2[j], se2[j]),
+            },
+        )
+    _per_variable = _per_variable_list(_var_names, _results, _errors)
+
+    _df_val, _stat, _p = float(_dfs[0]), float(_stats_t[0]), float(_ps[0])
     _interp = (
         f"Independent samples t-test (Welch): t({_df_val:.2f}) = {_stat:.3f}, "
         f"p {'<' if _p < _alpha else '>='} {_alpha:.4f}. "
-        f"Group 1 (M = {np.mean(_x1):.3f}, SD = {np.std(_x1, ddof=1):.3f}, n = {len(_x1)}) vs "
-        f"Group 2 (M = {np.mean(_x2):.3f}, SD = {np.std(_x2, ddof=1):.3f}, n = {len(_x2)})."
+        f"Group 1 (M = {m1[0]:.3f}, SD = {sd1[0]:.3f}, n = {n1[0]}) vs "
+        f"Group 2 (M = {m2[0]:.3f}, SD = {sd2[0]:.3f}, n = {n2[0]})."
     )
 
 elif _test_type == "paired":
@@ -231,11 +413,13 @@ elif _test_type == "paired":
     if var2_name not in _data:
         raise ValueError(f"Column '{var2_name}' not found in data")
 
-    _before = np.array(_data[var1_name], dtype=float)
-    _after = np.array(_data[var2_name], dtype=float)
+    _before = np.asarray(_data[var1_name], dtype=np.float64)
+    _after = np.asarray(_data[var2_name], dtype=np.float64)
 
-    # Remove pairwise missing
-    mask = ~np.isnan(_before) & ~np.isnan(_after)
+    # Remove pairwise missing: one mask, built in place
+    mask = np.isnan(_before)
+    mask |= np.isnan(_after)
+    np.logical_not(mask, out=mask)
     _before = _before[mask]
     _after = _after[mask]
     _diff = _before - _after
@@ -243,21 +427,29 @@ elif _test_type == "paired":
     if len(_diff) < 2:
         raise ValueError("At least 2 complete pairs are required")
 
-    _stat, _p = scipy_stats.ttest_rel(_before, _after, alternative=_alternative)
-    _df_val = float(len(_diff) - 1)
-    _se = float(np.std(_diff, ddof=1) / np.sqrt(len(_diff)))
-    _ci_dict = _ci(float(np.mean(_diff)), _se, _df_val, _alpha)
-    _effect = _cohens_d(_diff, mu=0.0)
-    _descriptives = {
-        "var1": _desc(_before),
-        "var2": _desc(_after),
-        "difference": _desc(_diff),
-    }
+    _sdiff = _stats(_diff)
+    _n, _mean, _, _sd, _se = _sdiff
+    _df_val = float(_n - 1)
+    _stat, _p = _t_test(_mean, _se, _df_val, _alternative)
+    _stat, _p = float(_stat), float(_p)
+    _b_n, _b_mean, _, _b_sd, _b_se = _stats(_before)
+    _a_n, _a_mean, _, _a_sd, _a_se = _stats(_after)
+    _per_variable = [
+        _variable_result(
+            f"{var1_name} - {var2_name}", _stat, _df_val, _p,
+            _cohens_d(_sdiff, mu=0.0), _ci(_mean, _se, _df_val, _alpha),
+            {
+                "var1": _desc(_b_n, _b_mean, _b_sd, _b_se),
+                "var2": _desc(_a_n, _a_mean, _a_sd, _a_se),
+                "difference": _desc(_n, _mean, _sd, _se),
+            },
+        )
+    ]
 
     _interp = (
         f"Paired samples t-test: t({int(_df_val)}) = {_stat:.3f}, "
         f"p {'<' if _p < _alpha else '>='} {_alpha:.4f}. "
-        f"Mean difference = {np.mean(_diff):.3f} (SD = {np.std(_diff, ddof=1):.3f}, n = {len(_diff)} pairs)."
+        f"Mean difference = {_mean:.3f} (SD = {_sd:.3f}, n = {_n} pairs)."
     )
 
 else:
@@ -265,15 +457,18 @@ else:
         f"Unknown test_type '{_test_type}'. Expected 'one-sample', 'independent', or 'paired'."
     )
 
+_first = _per_variable[0]
 result = {
     "test_type": _test_type,
-    "statistic": round(float(_stat), 6),
-    "df": round(_df_val, 4),
-    "p_value": round(float(_p), 8),
-    "significant": float(_p) < _alpha,
+    "statistic": _first["statistic"],
+    "df": _first["df"],
+    "p_value": _first["p_value"],
+    "significant": _first["significant"],
     "alpha": _alpha,
-    "effect_size": _effect,
-    "confidence_interval": _ci_dict,
-    "descriptives": _descriptives,
+    "effect_size": _first["effect_size"],
+    "confidence_interval": _first["confidence_interval"],
+    "descriptives": _first["descriptives"],
     "interpretation": _interp,
 }
+if _test_type != "paired":
+    result["per_variable"] = _per_variable
@@ -11,7 +11,8 @@ Wire format (stdin):
     "id": "<uuid>",
     "script": "<python source>",
     "data": { ...variables injected into namespace },
-    "packages": ["numpy", "pandas", ...]
+    "packages": ["numpy", "pandas", ...],
+    "debug": false                  # optional: include the full traceback
   }
 
 Wire format (stdout, last line):
@@ -20,30 +21,87 @@ Wire format (stdout, last line):
     "success": true|false,
     "result": <serialized result>,
     "error": "<message>",
-    "traceback": "<traceback>",
+    "traceback": "<traceback>",     # only when the request sets debug
     "output": "<captured stdout>",
     "plots": ["<base64 png>", ...]
   }
 """
 
+import os
 import sys
 import json
+import math
 import io
 import traceback
 import base64
 import contextlib
 
+# Optional at import time so the wrapper still answers (e.g. with an error
+# from the script) in environments without the scientific stack.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# orjson, when installed, parses the request and encodes the response in C
+# straight from/to bytes. It rejects ints wider than 64 bits, so those
+# responses fall back to the stdlib encoder. Both paths write NaN/Infinity
+# as null (see _dumps), since bare NaN is not valid JSON.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Serialization helpers
 # ---------------------------------------------------------------------------
 
+# Exact types that are already JSON-native (subclasses such as np.float64
+# are excluded so they still go through _serialize)
+_PRIMITIVE_TYPES = frozenset((type(None), bool, int, float, str))
+
+
+def _is_plain(obj, _depth=0) -> bool:
+    """
+    True if `obj` is built only from str-keyed dicts, lists and primitive
+    scalars, i.e. _serialize would return an equal copy of it. The check
+    allocates nothing, so it is cheaper than that rebuild.
+    """
+    t = type(obj)
+    if t in _PRIMITIVE_TYPES:
+        return True
+    if _depth >= 20:
+        return False
+    if t is dict:
+        for k, v in obj.items():
+            if type(k) is not str or not _is_plain(v, _depth + 1):
+                return False
+        return True
+    if t is list:
+        for v in obj:
+            if not _is_plain(v, _depth + 1):
+                return False
+        return True
+    return False
+
+
 def _serialize(obj, _depth=0):
     """
     Recursively serialize Python objects to JSON-compatible types.
     Handles numpy arrays, pandas DataFrames/Series, and common scalars.
     Depth limit prevents runaway recursion on circular structures.
+    Results that are already plain JSON (e.g. the t-test's) are returned
+    as they are.
     """
+    if _depth == 0 and _is_plain(obj):
+        return obj
+
     if _depth > 20:
         return str(obj)
 
@@ -51,9 +109,8 @@ def _serialize(obj, _depth=0):
     if obj is None or isinstance(obj, (bool, int, float, str)):
         return obj
 
-    # numpy scalars
-    try:
-        import numpy as np
+    # numpy scalars and arrays
+    if np is not None:
         if isinstance(obj, np.integer):
             return int(obj)
         if isinstance(obj, np.floating):
@@ -65,30 +122,28 @@ def _serialize(obj, _depth=0):
                 "__type": "ndarray",
                 "dtype": str(obj.dtype),
                 "shape": list(obj.shape),
-                "data": _serialize(obj.tolist(), _depth + 1),
+                "data": _serialize_values(obj, _depth + 1),
             }
-    except ImportError:
-        pass
 
     # pandas DataFrame
-    try:
-        import pandas as pd
+    if pd is not None:
         if isinstance(obj, pd.DataFrame):
             return {
                 "__type": "DataFrame",
                 "columns": list(obj.columns),
                 "index": _serialize(list(obj.index), _depth + 1),
-                "data": _serialize(obj.values.tolist(), _depth + 1),
+                "data": _serialize_values(obj.values, _depth + 1),
             }
         if isinstance(obj, pd.Series):
             return {
                 "__type": "DataFrame",
                 "columns": [str(obj.name) if obj.name is not None else "value"],
                 "index": _serialize(list(obj.index), _depth + 1),
-                "data": [[v] for v in _serialize(obj.tolist(), _depth + 1)],
+                "data": [[v] for v in (
+                    obj.to_numpy().tolist() if _is_native_dtype(obj.dtype)
+                    else _serialize(obj.tolist(), _depth + 1)
+                )],
             }
-    except ImportError:
-        pass
 
     # lists / tuples
     if isinstance(obj, (list, tuple)):
@@ -105,31 +160,59 @@ def _serialize(obj, _depth=0):
         return "<unserializable>"
 
 
+def _is_native_dtype(dtype) -> bool:
+    """
+    True for numpy bool, integer, float and unicode dtypes, whose tolist()
+    already yields JSON-native Python scalars.
+    """
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufU"
+
+
+def _serialize_values(arr, _depth):
+    """
+    Nested lists for an ndarray. Native dtypes skip the element-by-element
+    walk; other dtypes (object, bytes, datetime, ...) still go through it.
+    """
+    if _is_native_dtype(arr.dtype):
+        return arr.tolist()
+    return _serialize(arr.tolist(), _depth)
+
+
 # ---------------------------------------------------------------------------
 # Matplotlib capture
 # ---------------------------------------------------------------------------
 
 def _capture_plots():
     """
-    Return a list of base64-encoded PNG strings for all currently open
-    matplotlib figures, then close them.
+    Yield a base64-encoded PNG (as ASCII bytes) for each currently open
+    matplotlib figure, closing it once encoded. Figures are rendered lazily,
+    as _write_response streams them, so only one is held in memory at a time;
+    a figure whose rendering fails is reported on stderr and left out.
+    Scripts that never imported pyplot cannot have open figures, so matplotlib
+    is not imported on their behalf.
     """
-    plots = []
-    try:
-        import matplotlib
-        matplotlib.use("Agg")  # non-interactive backend
-        import matplotlib.pyplot as plt
-
-        for fig_num in plt.get_fignums():
-            fig = plt.figure(fig_num)
-            buf = io.BytesIO()
-            fig.savefig(buf, format="png", bbox_inches="tight", dpi=150)
-            buf.seek(0)
-            plots.append(base64.b64encode(buf.read()).decode("utf-8"))
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is None:
+        return
+
+    for fig_num in plt.get_fignums():
+        fig = plt.figure(fig_num)
+        buf = io.BytesIO()
+        # Fast zlib level: the PNG travels over local IPC, where encode
+        # time matters more than a somewhat larger payload
+        try:
+            fig.savefig(
+                buf, format="png", bbox_inches="tight", dpi=150,
+                pil_kwargs={"compress_level": 1},
+            )
+        except Exception as exc:
+            # The response head is already on stdout by now; a figure that
+            # fails to render is skipped so the JSON line stays complete
+            print(f"wrapper: skipped figure {fig_num}: {exc}", file=sys.stderr)
+            continue
+        finally:
             plt.close(fig)
-    except ImportError:
-        pass
-    return plots
+        yield base64.b64encode(buf.getbuffer())
 
 
 # ---------------------------------------------------------------------------
@@ -157,27 +240,35 @@ def _execute(request: dict) -> dict:
 
     # Build isolated namespace pre-populated with injected data.
     # Both the raw 'data' dict and its individual keys are injected so scripts
-    # can reference either `data["key"]` or the key as a bare variable.
-    namespace: dict = {"__builtins__": __builtins__}
-    namespace["data"] = data
-    namespace.update(data)
+    # can reference either `data["key"]` or the key as a bare variable (a
+    # "data" key of its own wins). Built in one pass; this costs one entry per
+    # injected variable, not per data row. The names must be real entries
+    # rather than resolved lazily: scripts probe options with `"x" in dir()`.
+    namespace: dict = {"__builtins__": __builtins__, "data": data, **data}
 
     # Capture stdout from the script
     stdout_capture = io.StringIO()
 
     try:
         with contextlib.redirect_stdout(stdout_capture):
-            exec(compile(script, "<method-studio-script>", "exec"), namespace)  # noqa: S102
-    except Exception:
-        tb = traceback.format_exc()
-        return {
+            # Compiled inside the try so syntax errors are reported like any
+            # other script error; file scripts keep their path in tracebacks
+            code = compile(script, script_path or "<method-studio-script>", "exec")
+            exec(code, namespace)  # noqa: S102
+    except Exception as exc:
+        # The one-line summary needs no frame walk or source-line reads;
+        # the full traceback is only formatted when asked for.
+        summary = "".join(traceback.format_exception_only(type(exc), exc))
+        response = {
             "id": req_id,
             "success": False,
-            "error": tb.strip().splitlines()[-1],
-            "traceback": tb,
+            "error": summary.strip().splitlines()[-1],
             "output": stdout_capture.getvalue(),
             "plots": [],
         }
+        if request.get("debug"):
+            response["traceback"] = traceback.format_exc()
+        return response
 
     plots = _capture_plots()
     raw_result = namespace.get("result")
@@ -191,32 +282,92 @@ def _execute(request: dict) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Wire encoding
+# ---------------------------------------------------------------------------
+
+def _loads(raw: bytes):
+    """Parse the raw request bytes (json.JSONDecodeError on bad input)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _finite(obj):
+    """Copy of a JSON-native object with NaN/Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _dumps(obj) -> bytes:
+    """
+    Encode a JSON-native object as UTF-8 JSON bytes. Non-finite floats
+    become null on both paths, as orjson writes them.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    try:
+        text = json.dumps(obj, ensure_ascii=False, allow_nan=False)
+    except ValueError:  # NaN/Infinity somewhere; only then pay for the copy
+        text = json.dumps(_finite(obj), ensure_ascii=False, allow_nan=False)
+    return text.encode("utf-8")
+
+
+def _write_response(response: dict) -> None:
+    """
+    Write the response envelope to stdout as one line of UTF-8 JSON.
+
+    "plots" (any iterable of base64 str/bytes) is streamed last, one figure
+    at a time, instead of being encoded into the envelope in one piece.
+    """
+    out = sys.stdout.buffer
+    plots = response.get("plots")
+    head = _dumps({k: v for k, v in response.items() if k != "plots"})
+    if plots is None:
+        out.write(head + b"\n")
+    else:
+        out.write(head[:-1])  # reopen the object
+        out.write(b',"plots":[' if len(response) > 1 else b'"plots":[')
+        for i, b64 in enumerate(plots):
+            # base64 needs no JSON escaping
+            out.write(b'"' if i == 0 else b',"')
+            out.write(b64.encode("ascii") if isinstance(b64, str) else b64)
+            out.write(b'"')
+        out.write(b"]}\n")
+    out.flush()
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
 def main():
-    # Configure matplotlib early so imports inside scripts see Agg backend
-    try:
-        import matplotlib
-        matplotlib.use("Agg")
-    except ImportError:
-        pass
+    # Scripts that plot get the non-interactive Agg backend when they import
+    # matplotlib; the env var avoids importing it up front for those that don't
+    os.environ["MPLBACKEND"] = "Agg"
 
-    raw = sys.stdin.read()
+    # Raw bytes: both parsers decode UTF-8 themselves, skipping the
+    # locale-dependent text layer
+    raw = sys.stdin.buffer.read()
     try:
-        request = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        response = {
+        request = _loads(raw)
+    except json.JSONDecodeError as exc:  # orjson's error subclasses it
+        _write_response({
             "id": "",
             "success": False,
             "error": f"Invalid JSON request: {exc}",
-        }
-        print(json.dumps(response), flush=True)
+        })
         return
 
-    response = _execute(request)
-    print(json.dumps(response), flush=True)
+    _write_response(_execute(request))
 
 
 if __name__ == "__main__":
@@ -38,6 +38,9 @@ export function serializeRequest(request: PythonRequest): string {
       : {},
     packages: request.packages ?? [],
   };
+  if (request.debug) {
+    wire.debug = true;
+  }
   return JSON.stringify(wire);
 }
 
@@ -125,6 +128,7 @@ export function deserializeResponse(wire: WireResponse): PythonResponse {
     success: wire.success,
     result: wire.result !== undefined ? deserializeValue(wire.result) : undefined,
     error: wire.error,
+    traceback: wire.traceback,
     output: wire.output,
     plots: wire.plots,
   };
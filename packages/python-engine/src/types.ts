@@ -10,6 +10,8 @@ export interface PythonRequest {
   data?: Record<string, unknown>;
   /** Python packages required for the script (will be auto-imported if available) */
   packages?: string[];
+  /** Include the full Python traceback in the response on failure */
+  debug?: boolean;
 }
 
 /**
@@ -24,6 +26,8 @@ export interface PythonResponse {
   result?: unknown;
   /** Error message if success is false */
   error?: string;
+  /** Full Python traceback, only when the request set debug */
+  traceback?: string;
   /** Captured stdout from the script */
   output?: string;
   /** Base64-encoded PNG plots captured from matplotlib */
@@ -70,6 +74,8 @@ export interface WireRequest {
   script: string;
   data: Record<string, unknown>;
   packages: string[];
+  /** Ask the wrapper to include the full traceback on failure. */
+  debug?: boolean;
 }
 
 export interface WireResponse {